@@ -0,0 +1,55 @@
+"""
+Benchmark the memory saved by compressed cache entries against the CPU time they cost.
+
+Run with ``python benchmarks/cache.py`` (or ``make bench``).
+"""
+
+import timeit
+
+from octosuite.core.cache import MemoryBackend, ResponseCache
+from octosuite.core.sanitiser import Sanitiser
+from octosuite.core.ttl import TTLPolicy
+
+from sanitise import repo_page
+
+
+def main(pages: int = 200):
+    """Fill a plain and a compressed cache with the same pages and compare them."""
+
+    page = Sanitiser().sanitise(repo_page())
+    # Identical items would flatter compression, so make every repository different
+    for number, repo in enumerate(page):
+        repo["id"] += number * 7919
+        repo["name"] = f"repo-{number}"
+        repo["full_name"] = f"octocat/repo-{number}"
+        repo["description"] = f"Repository number {number} of {len(page)}"
+        repo["stargazers_count"] = number * 13 % 997
+        repo["pushed_at"] = f"2024-{number % 12 + 1:02}-{number % 28 + 1:02}T10:00:00Z"
+    urls = [
+        f"https://api.github.com/users/octocat/repos?page={n}" for n in range(pages)
+    ]
+
+    results = {}
+    for name, compress in (("plain", False), ("compressed (zlib)", True)):
+        cache = ResponseCache(
+            backend=MemoryBackend(max_bytes=None),
+            policy=TTLPolicy(),
+            compress=compress,
+        )
+        store = timeit.timeit(lambda: [cache.set(url, page) for url in urls], number=1)
+        hit = timeit.timeit(lambda: [cache.get(url) for url in urls], number=1)
+        assert cache.get(urls[0]) == page, "cache returned different data"
+
+        used = cache.stats()["bytes"]
+        results[name] = used
+        print(
+            f"{name:20} {used / pages / 1024:8.1f} KiB/page "
+            f"{pages / store:10,.0f} stores/s {pages / hit:10,.0f} hits/s"
+        )
+
+    plain, compressed = results.values()
+    print(f"{'pages per budget':20} {plain / compressed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark the response sanitiser against the previous recursive implementation.
+
+Run with ``python benchmarks/sanitise.py`` (or ``make bench``).
+"""
+
+import copy
+import re
+import timeit
+
+from octosuite.core.sanitiser import Sanitiser
+
+
+def legacy_sanitise(response):
+    """The recursive, regex-based sanitiser that GitHub.sanitise_response used to be."""
+
+    pattern = re.compile(r"https://api\.github\.com")
+
+    if isinstance(response, list):
+        return [legacy_sanitise(item) for item in response]
+
+    if isinstance(response, dict):
+        keys_to_remove = [
+            key
+            for key, value in response.items()
+            if (isinstance(value, str) and pattern.search(value)) or value is None
+        ]
+        for key in keys_to_remove:
+            response.pop(key)
+
+        for key, value in response.items():
+            if isinstance(value, (dict, list)):
+                response[key] = legacy_sanitise(value)
+
+    return response
+
+
+def repo_page(size: int = 100) -> list:
+    """Build a page of repository objects shaped like GET /users/{user}/repos."""
+
+    api = "https://api.github.com/repos/octocat/repo"
+    owner = {
+        "login": "octocat",
+        "id": 583231,
+        "avatar_url": "https://avatars.githubusercontent.com/u/583231?v=4",
+        "gravatar_id": "",
+        "url": "https://api.github.com/users/octocat",
+        "html_url": "https://github.com/octocat",
+        "followers_url": "https://api.github.com/users/octocat/followers",
+        "repos_url": "https://api.github.com/users/octocat/repos",
+        "type": "User",
+        "site_admin": False,
+    }
+    repo = {
+        "id": 1296269,
+        "name": "repo",
+        "full_name": "octocat/repo",
+        "private": False,
+        "owner": owner,
+        "html_url": "https://github.com/octocat/repo",
+        "description": "This your first repo!",
+        "fork": False,
+        "homepage": None,
+        "language": None,
+        "mirror_url": None,
+        "created_at": "2011-01-26T19:01:12Z",
+        "pushed_at": "2011-01-26T19:06:43Z",
+        "stargazers_count": 80,
+        "watchers_count": 80,
+        "forks_count": 9,
+        "license": {"key": "mit", "name": "MIT License", "spdx_id": "MIT"},
+        "topics": ["octocat", "atom", "electron", "api"],
+        "permissions": {"admin": False, "push": False, "pull": True},
+    }
+    for endpoint in (
+        "forks",
+        "keys",
+        "collaborators",
+        "teams",
+        "hooks",
+        "issue_events",
+        "events",
+        "assignees",
+        "branches",
+        "tags",
+        "blobs",
+        "git_tags",
+        "git_refs",
+        "trees",
+        "statuses",
+        "languages",
+        "stargazers",
+        "contributors",
+        "subscribers",
+        "subscription",
+        "commits",
+        "git_commits",
+        "comments",
+        "issue_comment",
+        "contents",
+        "compare",
+        "merges",
+        "archive",
+        "downloads",
+        "issues",
+        "pulls",
+        "milestones",
+        "notifications",
+        "labels",
+        "releases",
+        "deployments",
+    ):
+        repo[f"{endpoint}_url"] = f"{api}/{endpoint}"
+
+    return [copy.deepcopy(repo) for _ in range(size)]
+
+
+def main(pages: int = 200):
+    """Time both sanitisers on the same pages and print their throughput."""
+
+    sanitiser = Sanitiser()
+    template = repo_page()
+    assert legacy_sanitise(copy.deepcopy(template)) == sanitiser.sanitise(
+        copy.deepcopy(template)
+    ), "sanitisers disagree"
+
+    results = {}
+    for name, func in (
+        ("legacy (recursive, regex)", legacy_sanitise),
+        ("Sanitiser (iterative, prefix)", sanitiser.sanitise),
+    ):
+        batches = [copy.deepcopy(template) for _ in range(pages)]
+        elapsed = timeit.timeit(lambda: func(batches.pop()), number=pages)
+        results[name] = pages / elapsed
+        print(f"{name:32} {pages / elapsed:10,.0f} pages/s")
+
+    legacy, current = results.values()
+    print(f"{'speed-up':32} {current / legacy:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,5 +3,19 @@ __version__ = "5.0.0"
 
 from .core.cache import cache
 from .core.models import User, Org, Repo, Search
+from .core.aio import AsyncGitHub, AsyncUser, AsyncOrg, AsyncRepo, AsyncSearch
 
-__all__ = ["User", "Org", "Repo", "Search", "cache", "__pkg__", "__version__"]
+__all__ = [
+    "User",
+    "Org",
+    "Repo",
+    "Search",
+    "AsyncGitHub",
+    "AsyncUser",
+    "AsyncOrg",
+    "AsyncRepo",
+    "AsyncSearch",
+    "cache",
+    "__pkg__",
+    "__version__",
+]
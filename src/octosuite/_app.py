@@ -17,4 +17,4 @@ def start():
     except KeyboardInterrupt:
         sys.exit()
     finally:
-        cache.clear()
+        cache.close()
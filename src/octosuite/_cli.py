@@ -5,15 +5,18 @@ Provides non-interactive access to GitHub data.
 """
 
 import argparse
-import json
 import sys
 import typing as t
 
+from requests import RequestException
 from rich.status import Status
 
 from . import __pkg__, __version__
 from ._lib import export_response, preview_response, console
+from .core import codec
+from .core.cache import cache
 from .core.models import User, Org, Repo, Search
+from .core.ratelimit import RateLimitError
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -47,6 +50,28 @@ def create_parser() -> argparse.ArgumentParser:
         default=100,
         help="maximum number of results per page (default: %(default)s)",
     )
+    parser.add_argument(
+        "-a",
+        "--all-pages",
+        action="store_true",
+        help="fetch every page from --page onwards",
+    )
+    parser.add_argument(
+        "-f",
+        "--fields",
+        type=lambda value: [
+            field.strip() for field in value.split(",") if field.strip()
+        ],
+        metavar="FIELDS",
+        help="comma-separated fields to keep, e.g. login,id",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        choices=["memory", "disk"],
+        help="keep responses in memory for this run, or on disk across runs "
+        "(default: $OCTOSUITE_CACHE or memory)",
+    )
     parser.add_argument("-j", "--json", action="store_true", help="output as JSON")
     parser.add_argument("-d", "--dir", metavar="DIR", help="export to directory")
 
@@ -122,6 +147,11 @@ def create_parser() -> argparse.ArgumentParser:
         dest="data_type",
         help="received events",
     )
+    user_parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="keep polling for new events and print them as NDJSON (with --events)",
+    )
     user_parser.set_defaults(data_type="profile")
 
     # Repo command
@@ -232,6 +262,11 @@ def create_parser() -> argparse.ArgumentParser:
         dest="data_type",
         help="labels",
     )
+    repo_parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="keep polling for new events and print them as NDJSON (with --events)",
+    )
     repo_parser.set_defaults(data_type="profile")
 
     # Org command
@@ -280,6 +315,11 @@ def create_parser() -> argparse.ArgumentParser:
         dest="data_type",
         help="members",
     )
+    org_parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="keep polling for new events and print them as NDJSON (with --events)",
+    )
     org_parser.set_defaults(data_type="profile")
 
     # Search command
@@ -356,17 +396,38 @@ def output(
             output_dir=export_dir,
         )
     elif as_json:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(codec.dumps(data, indent=True))
     else:
         preview_response(data=data, source=source, _type=data_type)
 
 
+def follow(entity: t.Union[User, Org, Repo], data_type: str):
+    """
+    Print an entity's new events as NDJSON, one per line, until interrupted.
+
+    :param entity: The user, organisation or repository to follow.
+    :param data_type: The event stream, "events" or "received_events".
+    """
+
+    for event in entity.follow_events(stream=data_type).follow():
+        print(codec.dumps(event), flush=True)
+
+
 def run():
     """Run the CLI."""
 
     parser = create_parser()
     args = parser.parse_args()
 
+    if getattr(args, "follow", False) and args.data_type not in (
+        "events",
+        "received_events",
+    ):
+        parser.error("--follow only works with --events or --received-events")
+
+    if args.cache:
+        cache.use(args.cache)
+
     if args.interactive:
         from .tui import run as run_tui
 
@@ -390,15 +451,24 @@ def run():
                 console.print(f"[red]User '{args.username}' not found[/red]")
                 sys.exit(1)
 
+            if args.follow:
+                follow(entity=user, data_type=args.data_type)
+                return
+
             method = getattr(user, args.data_type)
             with Status(
                 f"[dim]Getting {args.data_type} from {args.username}[/dim]…",
                 console=console,
             ):
                 data = (
-                    method()
+                    method(fields=args.fields)
                     if args.data_type == "profile"
-                    else method(page=args.page, per_page=min(args.per_page, 100))
+                    else method(
+                        page=args.page,
+                        per_page=min(args.per_page, 100),
+                        all_pages=args.all_pages,
+                        fields=args.fields,
+                    )
                 )
             output(
                 data=data,
@@ -425,16 +495,26 @@ def run():
                 console.print(f"[red]Repository '{args.repository}' not found[/red]")
                 sys.exit(1)
 
+            if args.follow:
+                follow(entity=repo, data_type=args.data_type)
+                return
+
             method = getattr(repo, args.data_type)
             with Status(
                 f"[dim]Getting {args.data_type} from {args.repository}[/dim]…",
                 console=console,
             ):
-                data = (
-                    method()
-                    if args.data_type in ("profile", "languages")
-                    else method(page=args.page, per_page=min(args.per_page, 100))
-                )
+                if args.data_type == "languages":
+                    data = method()
+                elif args.data_type == "profile":
+                    data = method(fields=args.fields)
+                else:
+                    data = method(
+                        page=args.page,
+                        per_page=min(args.per_page, 100),
+                        all_pages=args.all_pages,
+                        fields=args.fields,
+                    )
             output(
                 data=data,
                 as_json=args.json,
@@ -453,15 +533,24 @@ def run():
                 console.print(f"[red]Organisation '{args.name}' not found[/red]")
                 sys.exit(1)
 
+            if args.follow:
+                follow(entity=org, data_type=args.data_type)
+                return
+
             method = getattr(org, args.data_type)
             with Status(
                 f"[dim]Getting {args.data_type} from {args.name}[/dim]…",
                 console=console,
             ):
                 data = (
-                    method()
+                    method(fields=args.fields)
                     if args.data_type == "profile"
-                    else method(page=args.page, per_page=min(args.per_page, 100))
+                    else method(
+                        page=args.page,
+                        per_page=min(args.per_page, 100),
+                        all_pages=args.all_pages,
+                        fields=args.fields,
+                    )
                 )
             output(
                 data=data,
@@ -482,7 +571,7 @@ def run():
                 f"[dim]Searching {args.search_type} for '{args.query}'[/dim]…",
                 console=console,
             ):
-                result = method()
+                result = method(all_pages=args.all_pages, fields=args.fields)
             data = result.get("items", result) if isinstance(result, dict) else result
             output(
                 data=data,
@@ -492,6 +581,9 @@ def run():
                 export_dir=args.dir,
             )
 
+    except (RateLimitError, RequestException) as error:
+        console.print(f"[red]{error}[/red]")
+        sys.exit(1)
     except KeyboardInterrupt:
         console.print("\n[dim]Cancelled[/dim]")
         sys.exit(130)
@@ -1,5 +1,4 @@
 import csv
-import json
 import os
 import subprocess
 import typing as t
@@ -14,6 +13,7 @@ from rich.tree import Tree
 from update_checker import UpdateChecker
 
 from . import __pkg__, __version__
+from .core import codec
 
 __all__ = [
     "__pkg__",
@@ -116,7 +116,7 @@ def export_response(
 
         if file_format == "json":
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data_list, f, indent=2, ensure_ascii=False)
+                codec.dump(data_list, f, indent=True)
 
         elif file_format == "csv":
             if data_list:
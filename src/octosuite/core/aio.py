@@ -0,0 +1,501 @@
+import asyncio
+import functools
+import inspect
+import threading
+import typing as t
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import Response
+
+from .follow import EventFollower
+from .github import GitHub
+from .models import github, User, Org, Repo, Search
+
+__all__ = [
+    "AsyncGitHub",
+    "AsyncUser",
+    "AsyncOrg",
+    "AsyncRepo",
+    "AsyncSearch",
+    "AsyncEventFollower",
+    "async_github",
+    "shared_async_github",
+]
+
+
+class AsyncGitHub:
+    """
+    Asyncio front-end for a GitHub client.
+
+    Requests run on a bounded worker pool over the wrapped client's pooled session,
+    so they share its cache, rate limiter and response sanitising. Cache hits are
+    answered on the event loop without a round trip to the pool.
+    """
+
+    def __init__(self, client: t.Optional[GitHub] = None, concurrency: int = 100):
+        """
+        Initialise the AsyncGitHub client.
+
+        :param client: The GitHub client to send requests through, created with a
+            connection pool of `concurrency` connections if not given. A client whose
+            pool is smaller is used as it is, with a warning.
+        :param concurrency: Maximum number of requests in flight at the same time.
+        """
+
+        if client is None:
+            client = GitHub(pool_maxsize=concurrency)
+        elif client.pool_maxsize < concurrency:
+            warnings.warn(
+                f"The client keeps {client.pool_maxsize} connections for {concurrency} "
+                f"concurrent requests, the rest will open throwaway connections; "
+                f"call client.configure_pool(pool_maxsize={concurrency}) to keep them",
+                stacklevel=2,
+            )
+
+        self.client = client
+        self.concurrency = concurrency
+        self._executor: t.Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool blocking calls run on, started on first use."""
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency, thread_name_prefix="octosuite"
+                )
+            return self._executor
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the API the wrapped client talks to."""
+        return self.client.base_url
+
+    @property
+    def cache(self):
+        """Response cache shared with the wrapped client."""
+        return self.client.cache
+
+    async def _run(self, func: t.Callable, *args, **kwargs):
+        """
+        Run a blocking client call on the worker pool.
+
+        :param func: The blocking callable.
+        :param args: Positional arguments for the callable.
+        :param kwargs: Keyword arguments for the callable.
+        :return: Whatever the callable returns.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def request(
+        self,
+        url: str,
+        params: t.Optional[dict] = None,
+        headers: t.Optional[dict] = None,
+    ) -> Response:
+        """
+        Send a GET request, see GitHub.request.
+
+        :param url: The URL to request.
+        :param params: Optional query parameters for the request.
+        :param headers: Optional extra headers.
+        :return: The raw Response object.
+        """
+
+        return await self._run(self.client.request, url, params=params, headers=headers)
+
+    async def get(
+        self,
+        url: str,
+        params: t.Optional[dict] = None,
+        return_response: bool = False,
+        use_cache: bool = True,
+        revalidate: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+        raise_for_status: bool = False,
+    ) -> t.Union[dict, list, Response]:
+        """
+        Make a GET request to the GitHub API, see GitHub.get.
+
+        :param url: The API endpoint URL.
+        :param params: Optional query parameters for the request.
+        :param return_response: If True, return the raw Response object instead of JSON data.
+        :param use_cache: If True, use cached responses when available.
+        :param revalidate: If True, revalidate a cached response with a conditional request.
+        :param fields: Optional top-level fields to keep, dropping the rest.
+        :param raise_for_status: If True, raise for an error reply instead of returning
+            an empty list.
+        :return: Dictionary, list, or Response object depending on the request and parameters.
+        """
+
+        if use_cache and not return_response and not revalidate:
+            cached = self.cache.get(url, self.client.cache_params(params, fields))
+            if cached is not None:
+                return cached
+
+        return await self._run(
+            self.client.get,
+            url,
+            params=params,
+            return_response=return_response,
+            use_cache=use_cache,
+            revalidate=revalidate,
+            fields=fields,
+            raise_for_status=raise_for_status,
+        )
+
+    async def paginate(
+        self,
+        url: str,
+        params: dict,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Fetch one page of a paginated endpoint, or every page, see GitHub.paginate.
+
+        :param url: The API endpoint URL.
+        :param params: Query parameters, including 'page' and 'per_page'.
+        :param all_pages: If True, fetch every page from params['page'] onwards.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: List of items, or for search endpoints a dictionary with the merged 'items'.
+        """
+
+        if not all_pages:
+            cached = self.cache.get(url, self.client.cache_params(params, fields))
+            if cached is not None:
+                return cached
+
+        return await self._run(
+            self.client.paginate,
+            url,
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
+
+    async def iter_pages(
+        self, url: str, params: dict, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.AsyncIterator[dict]:
+        """
+        Lazily iterate over the items of a paginated endpoint, see GitHub.iter_pages.
+
+        :param url: The API endpoint URL.
+        :param params: Query parameters for the first page, including 'page' and 'per_page'.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Async iterator of items.
+        """
+
+        next_page = asyncio.ensure_future(
+            self._run(self.client.fetch_page, url, params, fields)
+        )
+        try:
+            while next_page is not None:
+                items, next_url = await next_page
+                next_page = (
+                    asyncio.ensure_future(
+                        self._run(self.client.fetch_page, next_url, None, fields)
+                    )
+                    if next_url
+                    else None
+                )
+                for item in items:
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def exists(self, url: str) -> tuple[bool, dict]:
+        """
+        Check whether the resource at a URL exists, see GitHub.exists.
+
+        :param url: The API endpoint URL of the resource.
+        :return: Tuple of (exists, response_data) where exists is True if the resource is found.
+        """
+
+        cached = self.cache.get(url)
+        if cached is not None:
+            return True, cached
+
+        missing = self.cache.get_missing(url)
+        if missing is not None:
+            return False, missing.data
+
+        return await self._run(self.client.exists, url)
+
+    async def is_valid_entity(
+        self, _type: t.Literal["user", "org", "repo"], **kwargs
+    ) -> bool:
+        """
+        Validate whether a GitHub entity exists, see GitHub.is_valid_entity.
+
+        :param _type: Type of entity to validate ("user", "org", or "repo").
+        :param kwargs: Entity identifiers (username for user/org, repo_owner and repo_name for repo).
+        :return: True if the entity exists, False otherwise.
+        """
+
+        return await self._run(self.client.is_valid_entity, _type, **kwargs)
+
+    def cache_response(
+        self, url: str, response: Response, params: t.Optional[dict] = None
+    ) -> t.Union[dict, list]:
+        """
+        Sanitise and cache a successful response, see GitHub.cache_response.
+
+        :param url: The URL the response was fetched from.
+        :param response: The successful Response object.
+        :param params: Optional query parameters used in the request.
+        :return: The sanitised response data.
+        """
+
+        return self.client.cache_response(url=url, response=response, params=params)
+
+    def sanitise_response(
+        self,
+        response: t.Union[dict, list],
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Remove API URLs and null values from response data, see GitHub.sanitise_response.
+
+        :param response: The response data to sanitise (dict or list).
+        :param fields: Optional top-level fields to keep (in each item, for lists).
+        :return: Sanitised response data.
+        """
+
+        return self.client.sanitise_response(response=response, fields=fields)
+
+    def close(self):
+        """Shut down the worker pool. The wrapped client is left open."""
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    async def __aenter__(self) -> "AsyncGitHub":
+        """Enter an async context, returning the client itself."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Shut down the worker pool on leaving the async context."""
+        self.close()
+
+
+@functools.lru_cache(maxsize=None)
+def shared_async_github() -> AsyncGitHub:
+    """
+    Get the async client shared by the async entity classes, creating it on first use.
+
+    It wraps the shared module-level GitHub client, whose connection pool is grown to
+    the async client's concurrency at that point, so plain synchronous use of octosuite
+    never pays for it.
+
+    :return: The shared AsyncGitHub.
+    """
+
+    concurrency = 100
+    if github.pool_maxsize < concurrency:
+        github.configure_pool(pool_maxsize=concurrency)
+    return AsyncGitHub(client=github, concurrency=concurrency)
+
+
+def __getattr__(name: str) -> t.Any:
+    """Resolve `async_github` to the shared async client without creating it at import."""
+
+    if name == "async_github":
+        return shared_async_github()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _SharedClient:
+    """Class attribute standing for the shared async client until an instance sets its own."""
+
+    def __get__(self, instance: t.Any, owner: type) -> AsyncGitHub:
+        return shared_async_github()
+
+
+class AsyncEventFollower(EventFollower):
+    """
+    Asynchronous counterpart of EventFollower, tailing a stream through an AsyncGitHub.
+
+    poll(), follow() and run() are coroutines (follow() an async iterator), and the
+    wait between polls yields to the event loop. stop() must be called from the loop
+    the follower runs on.
+    """
+
+    def __init__(self, url: str, client: AsyncGitHub, **kwargs):
+        """
+        Initialise the AsyncEventFollower.
+
+        :param url: URL of the event stream, e.g. a repository's /events endpoint.
+        :param client: The async client to poll through.
+        :param kwargs: Further options, see EventFollower.
+        """
+
+        super().__init__(url=url, client=client, **kwargs)
+        self._wakeup = asyncio.Event()
+
+    async def poll(self) -> list:
+        """
+        Check the stream once, see EventFollower.poll.
+
+        :return: List of new events, oldest first.
+        """
+
+        first_poll = self.polls == 0
+        response = await self.client.request(
+            url=self.url,
+            params={"per_page": self.per_page},
+            headers={"If-None-Match": self._etag} if self._etag else None,
+        )
+        if not self._start_poll(response):
+            return []
+
+        events = []
+        while True:
+            fresh, next_url = self._read_page(response)
+            events.extend(fresh)
+            if first_poll or next_url is None:
+                break
+            response = await self.client.request(url=next_url)
+            if response.status_code != 200:
+                break
+
+        return self._finish_poll(events, first_poll)
+
+    async def follow(self, max_polls: t.Optional[int] = None) -> t.AsyncIterator[dict]:
+        """
+        Poll the stream until stopped, yielding new events oldest first.
+
+        :param max_polls: Optional number of polls after which to stop.
+        :return: Async iterator of events.
+        """
+
+        self._stopped.clear()
+        self._wakeup.clear()
+        polls = 0
+        while not self._stopped.is_set():
+            for event in await self.poll():
+                yield event
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), max(self.poll_interval, self.interval or 0)
+                )
+            except TimeoutError:
+                pass
+
+    async def run(
+        self, callback: t.Callable[[dict], t.Any], max_polls: t.Optional[int] = None
+    ):
+        """
+        Poll the stream until stopped, calling a function with every new event.
+
+        :param callback: Called with each new event, oldest first; awaited if it
+            returns an awaitable.
+        :param max_polls: Optional number of polls after which to stop.
+        """
+
+        async for event in self.follow(max_polls=max_polls):
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+
+    def stop(self):
+        """Stop following, waking up a follower that is waiting for its next poll."""
+
+        super().stop()
+        self._wakeup.set()
+
+
+class _AsyncBulk:
+    """Asynchronous bulk lookups shared by the async entity classes."""
+
+    @classmethod
+    async def many(
+        cls,
+        identifiers: t.Iterable[str],
+        concurrency: t.Optional[int] = None,
+        client: t.Optional[AsyncGitHub] = None,
+    ) -> t.AsyncIterator[tuple[str, bool, dict]]:
+        """
+        Check many entities at once, see GitHubEntity.many.
+
+        :param identifiers: Identifiers of the entities, see from_identifier().
+        :param concurrency: Maximum number of lookups in flight at the same time,
+            the client's concurrency if not given.
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: Async iterator of (identifier, exists, profile) tuples in completion order.
+        """
+
+        client = client or cls.client
+        concurrency = concurrency or client.concurrency
+
+        async def lookup(identifier: str) -> tuple[str, bool, dict]:
+            try:
+                entity = cls.from_identifier(identifier, client=client)
+            except ValueError:
+                return identifier, False, {}
+            exists, profile = await entity.exists()
+            return identifier, exists, profile
+
+        identifiers = iter(identifiers)
+        pending = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    identifier = next(identifiers, None)
+                    if identifier is None:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(lookup(identifier)))
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncUser(_AsyncBulk, User):
+    """Asynchronous counterpart of User; every query method returns an awaitable."""
+
+    client: AsyncGitHub = _SharedClient()
+    follower = AsyncEventFollower
+
+
+class AsyncOrg(_AsyncBulk, Org):
+    """Asynchronous counterpart of Org; every query method returns an awaitable."""
+
+    client: AsyncGitHub = _SharedClient()
+    follower = AsyncEventFollower
+
+
+class AsyncRepo(_AsyncBulk, Repo):
+    """Asynchronous counterpart of Repo; every query method returns an awaitable."""
+
+    client: AsyncGitHub = _SharedClient()
+    follower = AsyncEventFollower
+
+
+class AsyncSearch(Search):
+    """Asynchronous counterpart of Search; every query method returns an awaitable."""
+
+    client: AsyncGitHub = _SharedClient()
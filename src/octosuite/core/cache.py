@@ -1,57 +1,790 @@
+import functools
 import hashlib
-import json
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
-__all__ = ["cache"]
+from . import codec
+from .frozen import freeze
+from .pages import CollectionCache
+from .ttl import TTLPolicy
+
+__all__ = [
+    "cache",
+    "CacheEntry",
+    "ResponseCache",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "SQLiteConnections",
+    "default_cache_path",
+    "CacheKey",
+]
+
+# (origin, path, sorted query parameters) of a canonicalised request
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+# Path segments that are followed by case-insensitive logins or repository names
+_ENTITY_SEGMENTS = {"users": 1, "orgs": 1, "repos": 2}
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> tuple[str, str, tuple[tuple[str, str], ...]]:
+    """
+    Split a URL into its canonical origin, path and query parameters.
+
+    The scheme and host are lower-cased, as are the login, organisation and repository
+    segments that follow /users/, /orgs/ and /repos/, because GitHub treats them
+    case-insensitively. Other segments, such as file paths, keep their case.
+
+    :param url: The URL to canonicalise.
+    :return: Tuple of (origin, path, sorted query parameters).
+    """
+
+    parts = urlsplit(url)
+    segments = parts.path.rstrip("/").split("/")
+    for index, segment in enumerate(segments):
+        folded = _ENTITY_SEGMENTS.get(segment)
+        if folded:
+            for position in range(index + 1, min(index + 1 + folded, len(segments))):
+                segments[position] = segments[position].lower()
+            break
+
+    return (
+        f"{parts.scheme.lower()}://{parts.netloc.lower()}",
+        "/".join(segments),
+        tuple(sorted(parse_qsl(parts.query, keep_blank_values=True))),
+    )
+
+
+class CacheEntry:
+    """A cached response payload together with its HTTP validators and expiry time."""
+
+    __slots__ = (
+        "data",
+        "etag",
+        "last_modified",
+        "stored_at",
+        "expires_at",
+        "size",
+        "compressed",
+        "status",
+    )
+
+    def __init__(
+        self,
+        data,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+        stored_at: t.Optional[float] = None,
+        expires_at: t.Optional[float] = None,
+        size: int = 0,
+        compressed: bool = False,
+        status: int = 200,
+    ):
+        """
+        Initialise a CacheEntry.
+
+        :param data: The sanitised response data.
+        :param etag: The ETag header sent with the response, if any.
+        :param last_modified: The Last-Modified header sent with the response, if any.
+        :param stored_at: Unix timestamp at which the entry was stored, defaults to now.
+        :param expires_at: Unix timestamp after which the entry is stale, None to never expire.
+        :param size: Approximate size of the data in bytes, used to enforce memory budgets.
+        :param compressed: Whether data holds the zlib-compressed JSON document instead
+            of the decoded response.
+        :param status: HTTP status of the response, 404 or 410 for a negative entry
+            recording that the resource does not exist.
+        """
+
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.time() if stored_at is None else stored_at
+        self.expires_at = expires_at
+        self.size = size
+        self.compressed = compressed
+        self.status = status
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry has not expired yet."""
+        return self.expires_at is None or time.time() < self.expires_at
+
+    def validators(self) -> dict:
+        """
+        Build the conditional request headers for revalidating this entry.
+
+        :return: Dictionary of If-None-Match/If-Modified-Since headers (may be empty).
+        """
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MemoryBackend:
+    """
+    Keeps cache entries in memory for the lifetime of the process.
+
+    The backend holds at most `max_bytes` of response data (as measured by the entries'
+    approximate sizes) and `max_entries` entries, evicting the least recently used
+    entries once either budget is exceeded.
+    """
+
+    persistent = False
+
+    def __init__(
+        self,
+        max_bytes: t.Optional[int] = 128 * 1024 * 1024,
+        max_entries: t.Optional[int] = None,
+    ):
+        """
+        Initialise the MemoryBackend.
+
+        :param max_bytes: Memory budget in bytes, None for no limit.
+        :param max_entries: Maximum number of entries, None for no limit.
+        """
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> t.Optional[CacheEntry]:
+        """
+        Look up an entry, marking it as recently used.
+
+        :param key: The cache key.
+        :return: The CacheEntry if found, None otherwise.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: CacheKey, entry: CacheEntry):
+        """
+        Store an entry, evicting the least recently used ones if it exceeds the budget.
+
+        An entry larger than the whole memory budget is not stored at all.
+
+        :param key: The cache key.
+        :param entry: The CacheEntry to store.
+        """
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                return
+
+            self._entries[key] = entry
+            self.bytes += entry.size
+
+            while (self.max_bytes is not None and self.bytes > self.max_bytes) or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key: CacheKey):
+        """
+        Delete an entry if it exists.
+
+        :param key: The cache key.
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry.size
+
+    def clear(self):
+        """Delete every entry."""
+
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def close(self):
+        """Release the backend; in-memory entries do not outlive it."""
+        self.clear()
+
+    def stats(self) -> dict:
+        """
+        Report how full the backend is.
+
+        :return: Dictionary with the entry count, bytes used, budget and evictions.
+        """
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteConnections:
+    """
+    Gives every thread its own connection to a SQLite database running in WAL mode.
+
+    Connections are opened so that any thread may close them: close() shuts all of
+    them, and those left by threads that have exited are closed as new ones open.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialise the SQLiteConnections.
+
+        :param path: Path of the database file.
+        """
+
+        self.path = path
+        self._local = threading.local()
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the database, opening it on first use.
+
+        :return: The sqlite3 Connection.
+        """
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                for thread in [
+                    thread for thread in self._connections if not thread.is_alive()
+                ]:
+                    self._connections.pop(thread).close()
+                self._connections[threading.current_thread()] = connection
+        return connection
+
+    def close(self):
+        """Close every open connection; threads open a new one on their next use."""
+
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+
+class SQLiteBackend:
+    """
+    Keeps cache entries in a SQLite database so they are shared across runs.
+
+    The database runs in WAL mode, so several octosuite processes can read it while
+    one of them writes. Every thread gets its own connection.
+    """
+
+    persistent = True
+
+    def __init__(self, path: t.Union[str, Path], retain_stale: float = 7 * 86400):
+        """
+        Initialise the SQLiteBackend, creating the database if needed.
+
+        :param path: Path of the database file.
+        :param retain_stale: Seconds to keep expired entries around for revalidation
+            before they are purged.
+        """
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = SQLiteConnections(self.path)
+
+        with self._connection() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL
+                )
+                """)
+            # Databases created before negative entries existed lack the status column
+            columns = {
+                row[1] for row in connection.execute("PRAGMA table_info(responses)")
+            }
+            if "status" not in columns:
+                connection.execute(
+                    "ALTER TABLE responses "
+                    "ADD COLUMN status INTEGER NOT NULL DEFAULT 200"
+                )
+            connection.execute(
+                "DELETE FROM responses WHERE expires_at < ?",
+                (time.time() - retain_stale,),
+            )
+
+    @staticmethod
+    def digest(key: CacheKey) -> str:
+        """
+        Turn a cache key into the stable string it is stored under.
+
+        :param key: The cache key.
+        :return: MD5 hash of the canonical URL the key stands for.
+        """
+
+        origin, path, query = key
+        return hashlib.md5(f"{origin}{path}?{urlencode(query)}".encode()).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the database, opening it on first use.
+
+        :return: The sqlite3 Connection.
+        """
+
+        return self._connections.get()
+
+    def get(self, key: CacheKey) -> t.Optional[CacheEntry]:
+        """
+        Look up an entry.
+
+        :param key: The cache key.
+        :return: The CacheEntry if found, None otherwise.
+        """
+
+        row = (
+            self._connection()
+            .execute(
+                "SELECT data, etag, last_modified, stored_at, expires_at, status "
+                "FROM responses WHERE key = ?",
+                (self.digest(key),),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        # Compressed entries are stored as BLOBs and come back as bytes, plain JSON as TEXT
+        data, etag, last_modified, stored_at, expires_at, status = row
+        compressed = type(data) is bytes
+        return CacheEntry(
+            data=data if compressed else freeze(codec.loads(data)),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+            expires_at=expires_at,
+            size=len(data),
+            compressed=compressed,
+            status=status,
+        )
+
+    def set(self, key: CacheKey, entry: CacheEntry):
+        """
+        Store an entry, replacing any existing one.
+
+        :param key: The cache key.
+        :param entry: The CacheEntry to store.
+        """
+
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, data, etag, last_modified, stored_at, expires_at, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.digest(key),
+                    entry.data if entry.compressed else codec.dumps(entry.data),
+                    entry.etag,
+                    entry.last_modified,
+                    entry.stored_at,
+                    entry.expires_at,
+                    entry.status,
+                ),
+            )
+
+    def delete(self, key: CacheKey):
+        """
+        Delete an entry if it exists.
+
+        :param key: The cache key.
+        """
+
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM responses WHERE key = ?", (self.digest(key),)
+            )
+
+    def clear(self):
+        """Delete every entry."""
+
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        """
+        Report how full the backend is.
+
+        :return: Dictionary with the entry count and the size of the database file.
+        """
+
+        return {
+            "entries": len(self),
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "max_bytes": None,
+            "evictions": 0,
+        }
+
+    def close(self):
+        """Close every connection opened by the backend."""
+
+        self._connections.close()
+
+    def __len__(self) -> int:
+        return (
+            self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        )
+
+
+def default_cache_path() -> Path:
+    """
+    Work out where the persistent cache lives.
+
+    :return: $OCTOSUITE_CACHE_DIR, or $XDG_CACHE_HOME/octosuite, or ~/.cache/octosuite,
+        joined with the database file name.
+    """
+
+    directory = os.environ.get("OCTOSUITE_CACHE_DIR")
+    if directory is None:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        directory = Path(base) / "octosuite"
+    return Path(directory) / "responses.sqlite3"
 
 
 class ResponseCache:
-    """Simple in-memory cache for API responses."""
+    """Cache for API responses, kept in memory or on disk."""
 
-    def __init__(self):
-        """Initialise the ResponseCache with an empty cache dictionary."""
+    COMPRESSION_LEVEL = 6
 
-        self._cache = {}
+    def __init__(
+        self,
+        backend: t.Optional[t.Union[MemoryBackend, SQLiteBackend]] = None,
+        ttl: t.Optional[float] = None,
+        policy: t.Optional[TTLPolicy] = None,
+        compress: bool = False,
+        negative_ttl: float = 300,
+    ):
+        """
+        Initialise the ResponseCache.
+
+        :param backend: Storage for the entries, in memory if not given.
+        :param ttl: Default number of seconds an entry stays fresh, None to never expire.
+        :param policy: Per-endpoint TTLs taking precedence over the default, read from
+            OCTOSUITE_CACHE_TTL on top of the built-in rules if not given.
+        :param compress: If True, store entries as zlib-compressed JSON and decompress
+            them on a hit, trading CPU time for memory and disk space.
+        :param negative_ttl: Seconds to remember that a resource does not exist.
+        """
+
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.policy = policy if policy is not None else TTLPolicy.from_env()
+        self.compress = compress
+        self.negative_ttl = negative_ttl
+        self.collections = CollectionCache(load=self._load_page)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.negative_stores = 0
+        self._lock = threading.Lock()
+
+    def use(
+        self,
+        backend: t.Literal["memory", "disk"],
+        path: t.Optional[t.Union[str, Path]] = None,
+        ttl: t.Optional[float] = None,
+        max_bytes: t.Optional[int] = 128 * 1024 * 1024,
+        compress: t.Optional[bool] = None,
+    ):
+        """
+        Switch to a memory-only or on-disk backend, closing the current one.
+
+        :param backend: "memory" for a per-process cache, "disk" for a SQLite cache
+            shared across runs.
+        :param path: Database path for the disk backend, see default_cache_path().
+        :param ttl: Default number of seconds an entry stays fresh when no rule of the
+            TTL policy matches. The disk backend defaults to an hour so that later runs
+            revalidate rather than trust old data.
+        :param max_bytes: Memory budget of the memory backend in bytes, None for no limit.
+        :param compress: Whether to compress entries, by default only on disk.
+        """
+
+        self.backend.close()
+        if backend == "disk":
+            self.backend = SQLiteBackend(path or default_cache_path())
+            self.ttl = 3600 if ttl is None else ttl
+            self.compress = True if compress is None else compress
+        else:
+            self.backend = MemoryBackend(max_bytes=max_bytes)
+            self.ttl = ttl
+            self.compress = bool(compress)
 
     @staticmethod
-    def _generate_key(url: str, params: dict = None) -> str:
+    def _generate_key(url: str, params: dict = None) -> CacheKey:
         """
-        Generate a unique cache key from URL and parameters.
+        Generate a cache key from URL and parameters.
+
+        Equivalent requests share a key: parameters may be given in the URL or as a
+        dictionary, in any order and as strings or numbers, and logins and repository
+        names are compared case-insensitively.
 
         :param url: The URL to generate a key for.
         :param params: Optional dictionary of parameters to include in the key.
-        :return: MD5 hash string representing the unique cache key.
+        :return: Hashable tuple of (origin, path, sorted query parameters).
+        """
+
+        origin, path, query = _canonical_url(url)
+        if not params:
+            return origin, path, query
+
+        # Same encoding rules as requests: None is dropped, sequences repeat the name
+        items = list(query)
+        for name, value in params.items():
+            if value is None:
+                continue
+            for item in value if isinstance(value, (list, tuple)) else (value,):
+                items.append((str(name), str(item)))
+        return origin, path, tuple(sorted(items))
+
+    def key(self, url: str, params: dict = None) -> CacheKey:
+        """
+        Get the cache key a URL and its parameters are stored under.
+
+        :param url: The URL of the request.
+        :param params: Optional dictionary of parameters used in the request.
+        :return: The cache key.
         """
 
-        cache_data = f"{url}:{json.dumps(params or {}, sort_keys=True)}"
-        return hashlib.md5(cache_data.encode()).hexdigest()
+        return self._generate_key(url, params)
 
     def get(self, url: str, params: dict = None):
         """
-        Retrieve a cached response if it exists.
+        Retrieve a cached response if it exists and has not expired.
 
         :param url: The URL to retrieve cached data for.
         :param params: Optional dictionary of parameters used in the original request.
         :return: Cached response data if found, None otherwise.
         """
 
+        entry = self.get_entry(url, params)
+        return entry.data if entry is not None else None
+
+    def get_entry(
+        self, url: str, params: dict = None, allow_stale: bool = False
+    ) -> t.Optional[CacheEntry]:
+        """
+        Retrieve a cached entry, including its validators, if it exists.
+
+        :param url: The URL to retrieve the cached entry for.
+        :param params: Optional dictionary of parameters used in the original request.
+        :param allow_stale: If True, also return an expired entry, e.g. to revalidate it.
+        :return: The CacheEntry if found, None otherwise. Negative entries are never
+            returned, see get_missing().
+        """
+
         key = self._generate_key(url, params)
-        return self._cache.get(key)
+        entry = self.backend.get(key)
+
+        with self._lock:
+            if entry is None or entry.status != 200:
+                self.misses += 1
+                return None
+            if not entry.is_fresh:
+                if not allow_stale:
+                    self.misses += 1
+                    return None
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+
+        if entry.compressed:
+            return CacheEntry(
+                data=freeze(codec.loads(zlib.decompress(entry.data))),
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                stored_at=entry.stored_at,
+                expires_at=entry.expires_at,
+                size=entry.size,
+            )
+        return entry
+
+    def _load_page(self, key: CacheKey) -> t.Optional[list]:
+        """
+        Read a fresh cached page back for the collection cache, without counting a hit.
+
+        :param key: The page's cache key.
+        :return: The page's items, or None if it is not cached, has expired or is not
+            a list.
+        """
+
+        entry = self.backend.get(key)
+        if entry is None or entry.status != 200 or not entry.is_fresh:
+            return None
+        data = entry.data
+        if entry.compressed:
+            data = freeze(codec.loads(zlib.decompress(data)))
+        return data if isinstance(data, list) else None
+
+    def get_missing(self, url: str, params: dict = None) -> t.Optional[CacheEntry]:
+        """
+        Retrieve a fresh negative entry, recording that a resource does not exist.
+
+        :param url: The URL of the resource.
+        :param params: Optional dictionary of parameters used in the original request.
+        :return: The negative CacheEntry, holding the error response, if found.
+        """
+
+        entry = self.backend.get(self._generate_key(url, params))
+        if entry is None or entry.status == 200 or not entry.is_fresh:
+            return None
+
+        with self._lock:
+            self.negative_hits += 1
+        return entry
+
+    def set_missing(
+        self,
+        url: str,
+        data,
+        params: dict = None,
+        status: int = 404,
+        ttl: t.Optional[float] = None,
+    ):
+        """
+        Remember for a short while that a resource does not exist.
 
-    def set(self, url: str, data, params: dict = None):
+        :param url: The URL of the resource.
+        :param data: The error response data.
+        :param params: Optional dictionary of parameters used in the request.
+        :param status: The HTTP status of the response, 404 or 410.
+        :param ttl: Optional number of seconds to keep the entry, overriding negative_ttl.
+        """
+
+        ttl = self.negative_ttl if ttl is None else ttl
+        now = time.time()
+        self.backend.set(
+            self._generate_key(url, params),
+            CacheEntry(
+                data=freeze(data),
+                stored_at=now,
+                expires_at=now + ttl,
+                size=len(codec.dumps(data)),
+                status=status,
+            ),
+        )
+        with self._lock:
+            self.negative_stores += 1
+
+    def set(
+        self,
+        url: str,
+        data,
+        params: dict = None,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+        ttl: t.Optional[float] = None,
+        size: t.Optional[int] = None,
+    ):
         """
         Store a response in the cache.
 
         :param url: The URL to cache data for.
         :param data: The response data to cache.
         :param params: Optional dictionary of parameters used in the request.
+        :param etag: Optional ETag header of the response, used for revalidation.
+        :param last_modified: Optional Last-Modified header of the response, used for revalidation.
+        :param ttl: Optional number of seconds the entry stays fresh, overriding the
+            TTL policy and the default.
+        :param size: Optional size of the data in bytes, e.g. the length of the response
+            body. Measured by serialising the data if not given, and replaced by the
+            compressed size when compressing.
         """
 
+        if ttl is None:
+            ttl = self.policy.ttl_for(url, default=self.ttl)
+        compressed = self.compress
+        if compressed:
+            data = zlib.compress(codec.dumps(data).encode(), self.COMPRESSION_LEVEL)
+            size = len(data)
+        elif size is None:
+            size = len(codec.dumps(data))
+        now = time.time()
         key = self._generate_key(url, params)
-        self._cache[key] = data
+        self.backend.set(
+            key,
+            CacheEntry(
+                data=data,
+                etag=etag,
+                last_modified=last_modified,
+                stored_at=now,
+                expires_at=None if ttl is None else now + ttl,
+                size=size,
+                compressed=compressed,
+            ),
+        )
 
     def clear(self):
-        """Clear all cached responses from memory."""
-        self._cache.clear()
+        """Clear all cached responses."""
+
+        self.backend.clear()
+        self.collections.clear()
+
+    def stats(self) -> dict:
+        """
+        Report how well the cache is doing.
+
+        :return: Dictionary with hit, stale hit and miss counters, the hit rate, the
+            negative entry counters, the page window counters and the backend's size and
+            eviction counters.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            counters = {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "negative_hits": self.negative_hits,
+                "negative_stores": self.negative_stores,
+            }
+        return {**counters, **self.collections.stats(), **self.backend.stats()}
+
+    def close(self):
+        """Release the backend. Persistent entries stay on disk for the next run."""
+        self.backend.close()
 
     def remove(self, url: str, params: dict = None):
         """
@@ -62,10 +795,12 @@ class ResponseCache:
         """
 
         key = self._generate_key(url, params)
-        self._cache.pop(key, None)
+        self.backend.delete(key)
 
 
 cache = ResponseCache()
+if os.environ.get("OCTOSUITE_CACHE") == "disk":
+    cache.use("disk")
 
 
 def clear_cache():
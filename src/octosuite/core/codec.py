@@ -0,0 +1,82 @@
+"""
+JSON encoding and decoding through the fastest backend that is installed.
+
+orjson is preferred, then msgspec, falling back to the standard library's json
+module. Install the 'fast' extra (``pip install octosuite[fast]``) to get orjson.
+"""
+
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = ["BACKEND", "loads", "dumps", "dump"]
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+
+def loads(data: t.Union[bytes, str]) -> t.Any:
+    """
+    Decode a JSON document.
+
+    :param data: The JSON document, preferably as the raw response bytes.
+    :return: The decoded object.
+    :raises ValueError: If the document is not valid JSON.
+    """
+
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as error:
+            raise ValueError(str(error)) from error
+    return json.loads(data)
+
+
+def dumps(obj: t.Any, indent: bool = False) -> str:
+    """
+    Encode an object as a JSON document, leaving non-ASCII characters unescaped.
+
+    :param obj: The object to encode.
+    :param indent: If True, pretty-print with two-space indentation.
+    :return: The JSON document.
+    """
+
+    if BACKEND == "orjson":
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    if BACKEND == "msgspec":
+        encoded = msgspec.json.encode(obj)
+        if indent:
+            encoded = msgspec.json.format(encoded, indent=2)
+        return encoded.decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dump(obj: t.Any, fp: t.TextIO, indent: bool = False):
+    """
+    Encode an object as a JSON document and write it to a text file.
+
+    :param obj: The object to encode.
+    :param fp: The file object to write to.
+    :param indent: If True, pretty-print with two-space indentation.
+    """
+
+    if BACKEND == "json":
+        json.dump(obj, fp, indent=2 if indent else None, ensure_ascii=False)
+    else:
+        fp.write(dumps(obj, indent=indent))
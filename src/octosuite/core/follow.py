@@ -0,0 +1,187 @@
+import threading
+import typing as t
+from collections import deque
+
+from requests import Response
+
+from . import codec
+from .github import GitHub
+
+__all__ = ["EventFollower"]
+
+
+class EventFollower:
+    """
+    Tails an event stream, yielding each event once as it appears.
+
+    Every poll is a conditional request carrying the ETag of the previous reply, so a
+    stream without new events costs a 304, which does not count against the rate
+    limit. Polls are spaced by GitHub's X-Poll-Interval header (60 seconds unless it
+    asks for more), and events are deduplicated by id.
+    """
+
+    # Seconds between polls until GitHub sends an X-Poll-Interval header
+    DEFAULT_INTERVAL = 60
+
+    def __init__(
+        self,
+        url: str,
+        client: GitHub,
+        interval: t.Optional[float] = None,
+        include_existing: bool = True,
+        per_page: int = 100,
+        remember: int = 1000,
+    ):
+        """
+        Initialise the EventFollower.
+
+        :param url: URL of the event stream, e.g. a repository's /events endpoint.
+        :param client: The client to poll through.
+        :param interval: Seconds between polls, never less than GitHub's X-Poll-Interval.
+        :param include_existing: If True, start with the events already in the stream;
+            otherwise only yield events that appear after the first poll.
+        :param per_page: Number of events to request per page.
+        :param remember: Number of recent event ids kept for deduplication.
+        """
+
+        self.url = url
+        self.client = client
+        self.interval = interval
+        self.include_existing = include_existing
+        self.per_page = per_page
+        self.poll_interval = self.DEFAULT_INTERVAL
+        self.polls = 0
+        self.not_modified = 0
+        self._etag: t.Optional[str] = None
+        self._seen: set[str] = set()
+        self._order: deque[str] = deque(maxlen=remember)
+        self._stopped = threading.Event()
+
+    def _remember(self, event_id: str):
+        """
+        Record an event id, forgetting the oldest one beyond the deduplication window.
+
+        :param event_id: The event's id.
+        """
+
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+        self._order.append(event_id)
+        self._seen.add(event_id)
+
+    def _start_poll(self, response: Response) -> bool:
+        """
+        Count a poll and take the interval and ETag from its reply.
+
+        :param response: Reply to the poll's first request.
+        :return: True if the reply lists events, False if it is a 304 or an error.
+        """
+
+        self.polls += 1
+        self.poll_interval = int(
+            response.headers.get("X-Poll-Interval", self.poll_interval)
+        )
+        if response.status_code == 304:
+            self.not_modified += 1
+            return False
+        if response.status_code != 200:
+            return False
+        self._etag = response.headers.get("ETag")
+        return True
+
+    def _read_page(self, response: Response) -> tuple[list, t.Optional[str]]:
+        """
+        Pick the unseen events out of a page.
+
+        :param response: The page's reply.
+        :return: Tuple of (unseen events, URL of the next page to read or None once a
+            page holds an event seen before).
+        """
+
+        page = self.client.sanitise_response(codec.loads(response.content))
+        fresh = [event for event in page if str(event["id"]) not in self._seen]
+        if len(fresh) < len(page):
+            return fresh, None
+        return fresh, response.links.get("next", {}).get("url")
+
+    def _finish_poll(self, events: list, first_poll: bool) -> list:
+        """
+        Remember the events of a poll and decide which of them to hand out.
+
+        :param events: The poll's new events, newest first as the pages list them.
+        :param first_poll: Whether this was the follower's first poll.
+        :return: List of new events, oldest first.
+        """
+
+        events.reverse()
+        for event in events:
+            self._remember(str(event["id"]))
+        if first_poll and not self.include_existing:
+            return []
+        return events
+
+    def poll(self) -> list:
+        """
+        Check the stream once.
+
+        New events are collected page by page until a page contains an event that was
+        seen before, so a burst larger than one page is not cut short.
+
+        :return: List of new events, oldest first.
+        """
+
+        first_poll = self.polls == 0
+        response = self.client.request(
+            url=self.url,
+            params={"per_page": self.per_page},
+            headers={"If-None-Match": self._etag} if self._etag else None,
+        )
+        if not self._start_poll(response):
+            return []
+
+        events = []
+        while True:
+            fresh, next_url = self._read_page(response)
+            events.extend(fresh)
+            if first_poll or next_url is None:
+                break
+            response = self.client.request(url=next_url)
+            if response.status_code != 200:
+                break
+
+        return self._finish_poll(events, first_poll)
+
+    def follow(self, max_polls: t.Optional[int] = None) -> t.Iterator[dict]:
+        """
+        Poll the stream until stopped, yielding new events oldest first.
+
+        :param max_polls: Optional number of polls after which to stop.
+        :return: Iterator of events.
+        """
+
+        self._stopped.clear()
+        polls = 0
+        while not self._stopped.is_set():
+            yield from self.poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            self._stopped.wait(max(self.poll_interval, self.interval or 0))
+
+    def run(
+        self, callback: t.Callable[[dict], t.Any], max_polls: t.Optional[int] = None
+    ):
+        """
+        Poll the stream until stopped, calling a function with every new event.
+
+        :param callback: Called with each new event, oldest first.
+        :param max_polls: Optional number of polls after which to stop.
+        """
+
+        for event in self.follow(max_polls=max_polls):
+            callback(event)
+
+    def stop(self):
+        """Stop following, waking up a follower that is waiting for its next poll."""
+
+        self._stopped.set()
@@ -0,0 +1,138 @@
+import typing as t
+
+__all__ = ["FrozenDict", "FrozenList", "freeze", "thaw"]
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is read-only, use .copy() or thaw() for a mutable copy"
+    )
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict handed out by the response cache.
+
+    It is still a dict, so it serialises, compares and type-checks like one. Every
+    mutating method raises TypeError. `.copy()` returns a plain, mutable dict whose
+    nested values stay shared and frozen, i.e. copy-on-write one level at a time.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def thaw(self) -> dict:
+        """
+        Make a mutable deep copy.
+
+        :return: Plain dict with plain dicts and lists all the way down.
+        """
+
+        return thaw(self)
+
+
+class FrozenList(list):
+    """
+    Read-only list handed out by the response cache, see FrozenDict.
+
+    `.copy()` and slicing return plain, mutable lists of the same frozen items.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+    def thaw(self) -> list:
+        """
+        Make a mutable deep copy.
+
+        :return: Plain list with plain dicts and lists all the way down.
+        """
+
+        return thaw(self)
+
+
+def _rebuild(data: t.Any, as_dict: type, as_list: type) -> t.Any:
+    """
+    Copy every dict and list of a JSON-like structure into the given container types.
+
+    Containers are collected with an explicit stack and rebuilt children first, so
+    deep payloads cannot exhaust the recursion limit.
+
+    :param data: The structure to rebuild.
+    :param as_dict: Type to build dicts as.
+    :param as_list: Type to build lists as.
+    :return: The rebuilt structure.
+    """
+
+    if not isinstance(data, (dict, list)):
+        return data
+
+    # (parent, key, node) in pre-order, so reversing it visits children before parents
+    order = []
+    stack = [(None, None, data)]
+    while stack:
+        parent, key, node = stack.pop()
+        order.append((parent, key, node))
+        for child_key, child in (
+            node.items() if isinstance(node, dict) else enumerate(node)
+        ):
+            if isinstance(child, (dict, list)):
+                stack.append((node, child_key, child))
+
+    rebuilt = {}
+    for parent, key, node in reversed(order):
+        if isinstance(node, dict):
+            copy = as_dict(
+                (name, rebuilt.get(id(value), value)) for name, value in node.items()
+            )
+        else:
+            copy = as_list(rebuilt.get(id(value), value) for value in node)
+        if parent is None:
+            return copy
+        rebuilt[id(node)] = copy
+
+
+def freeze(data: t.Any) -> t.Any:
+    """
+    Make a read-only copy of response data.
+
+    :param data: Decoded response data.
+    :return: The data with every dict and list replaced by a FrozenDict or FrozenList.
+    """
+
+    if type(data) is FrozenDict or type(data) is FrozenList:
+        return data
+    return _rebuild(data, FrozenDict, FrozenList)
+
+
+def thaw(data: t.Any) -> t.Any:
+    """
+    Make a mutable deep copy of (possibly frozen) response data.
+
+    :param data: Response data.
+    :return: The data with every dict and list replaced by a plain dict or list.
+    """
+
+    return _rebuild(data, dict, list)
@@ -1,21 +1,38 @@
-import re
+import functools
 import sys
+import threading
+import time
 import typing as t
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, parse_qsl
 
 import requests
 from requests import Response
-
-from .cache import cache
+from requests.adapters import HTTPAdapter
+
+from . import codec
+from .cache import cache, CacheEntry, CacheKey
+from .frozen import freeze
+from .pages import plan_pages
+from .ratelimit import RateLimiter, RateLimitError
+from .retry import RetriesExhaustedError, RetryPolicy
+from .sanitiser import Sanitiser
+from .singleflight import SingleFlight
+from .tokens import TokenPool
 from .._lib import __version__
 
 BASE_URL = "https://api.github.com"
 
-__all__ = ["BASE_URL", "GitHub"]
+__all__ = ["BASE_URL", "GitHub", "RateLimitError"]
 
 
 class GitHub:
     """Handles GitHub API requests with caching and response sanitisation."""
 
+    # Page counts remembered from Link headers, so all-pages runs can start from the cache
+    MAX_LAST_PAGES = 1024
+
     def __init__(
         self,
         user_agent: str = (
@@ -23,15 +40,237 @@ class GitHub:
             f"(Python {sys.version.split()[0]}; "
             f"https://github.com/bellingcat/octosuite) requests/{requests.__version__}"
         ),
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: t.Optional[float] = 30,
+        tokens: t.Optional[t.Union[t.Iterable[str], TokenPool]] = None,
+        max_rate_limit_retries: int = 3,
+        retry: t.Optional[RetryPolicy] = None,
+        base_url: str = BASE_URL,
+        page_workers: int = 8,
+        sanitiser: t.Optional[Sanitiser] = None,
+        stale_while_revalidate: bool = False,
     ):
         """
         Initialise the GitHub API client.
 
         :param user_agent: Custom User-Agent string for API requests.
+        :param pool_connections: Number of per-host connection pools to keep.
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host.
+        :param pool_block: If True, wait for a free connection when a pool is full
+            instead of opening a throwaway one.
+        :param timeout: Seconds to wait for the server before giving up, or None to wait forever.
+        :param tokens: Personal access tokens to rotate between, or a ready TokenPool.
+            Read from OCTOSUITE_TOKENS/GITHUB_TOKEN if not given.
+        :param max_rate_limit_retries: How many times to resend a request rejected by a rate limit.
+        :param retry: RetryPolicy for replaying requests that fail with 5xx replies or
+            connection errors.
+        :param base_url: Root URL of the API, e.g. a GitHub Enterprise or local stub server.
+        :param page_workers: Maximum number of pages fetched at the same time when
+            collecting every page of a paginated endpoint.
+        :param sanitiser: Sanitiser with the rules applied to every response.
+        :param stale_while_revalidate: If True, answer with an expired cache entry straight
+            away and refresh it in the background, so the next call gets the fresh data.
         """
 
+        self.base_url = base_url.rstrip("/")
         self.user_agent = user_agent
+        self.timeout = timeout
         self.cache = cache
+        if tokens is None:
+            tokens = TokenPool.from_env()
+        elif not isinstance(tokens, TokenPool):
+            tokens = TokenPool(tokens=tokens)
+        self.tokens = tokens
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.retry = retry or RetryPolicy()
+        self.inflight = SingleFlight()
+        self.page_workers = page_workers
+        self.sanitiser = sanitiser or Sanitiser()
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refresher: t.Optional[ThreadPoolExecutor] = None
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        self._last_pages: OrderedDict[CacheKey, int] = OrderedDict()
+        self._last_pages_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": user_agent})
+        self.configure_pool(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def configure_pool(
+        self,
+        pool_connections: t.Optional[int] = None,
+        pool_maxsize: t.Optional[int] = None,
+        pool_block: t.Optional[bool] = None,
+    ):
+        """
+        Mount a connection pool with new limits on the session.
+
+        Connections held by the previous pool are dropped, so this is best done
+        before the client is put to work.
+
+        :param pool_connections: Number of per-host connection pools to keep.
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host.
+        :param pool_block: If True, wait for a free connection when a pool is full.
+        """
+
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            self.pool_block = pool_block
+
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def request(
+        self,
+        url: str,
+        params: t.Optional[dict] = None,
+        headers: t.Optional[dict] = None,
+        method: str = "GET",
+        json: t.Optional[dict] = None,
+    ) -> Response:
+        """
+        Send a request (GET unless told otherwise) through the client's pooled keep-alive session.
+
+        Each request is sent with the pooled token that has the most budget left and is
+        paced by that token's rate limiter. A request rejected by a primary or secondary
+        rate limit is sent again, with another token if one has budget. 5xx replies and
+        dropped connections are replayed with backoff according to the retry policy.
+
+        :param url: The URL to request.
+        :param params: Optional query parameters for the request.
+        :param headers: Optional extra headers, e.g. conditional request validators.
+        :param method: HTTP method, e.g. "POST" for GraphQL queries, which are
+            idempotent too and therefore safe to replay.
+        :param json: Optional JSON body.
+        :return: The raw Response object.
+        :raises RateLimitError: If the budget is exhausted and the rate limiter may not
+            wait, or a rate limit kept rejecting the request.
+        :raises CircuitOpenError: If GitHub kept failing and the circuit breaker is open.
+        :raises RetriesExhaustedError: If GitHub still answers with a 5xx reply after
+            every retry.
+        :raises requests.RequestException: If the connection still fails after every retry.
+        """
+
+        attempt = 0
+        rate_limited = 0
+        while True:
+            self.retry.breaker.check()
+            token = self.tokens.acquire(url)
+
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers={**(headers or {}), **token.headers()},
+                    timeout=self.timeout,
+                )
+            except requests.RequestException as error:
+                if not self.retry.should_retry(attempt, error=error):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if token.record(url, response):
+                if rate_limited < self.max_rate_limit_retries:
+                    rate_limited += 1
+                    continue
+                self.retry.give_up()
+                bucket = token.limiter.bucket(RateLimiter.resource_for(url))
+                raise RateLimitError(
+                    resource=bucket.resource, reset_at=bucket.resumes_at()
+                )
+
+            if self.retry.should_retry(attempt, response=response):
+                time.sleep(self.retry.delay(attempt, response=response))
+                attempt += 1
+                continue
+
+            if response.status_code in self.retry.RETRY_STATUSES:
+                raise RetriesExhaustedError(
+                    f"GitHub answered {url} with HTTP {response.status_code} "
+                    f"{attempt + 1} times, giving up",
+                    response=response,
+                )
+            return response
+
+    def connection_stats(self) -> dict:
+        """
+        Report how the connection pools have been used so far.
+
+        :return: Dictionary with the number of requests sent, connections opened,
+            and connections reused.
+        """
+
+        pools = self.adapter.poolmanager.pools
+        requests_sent = 0
+        connections_opened = 0
+        for key in pools.keys():
+            pool = pools[key]
+            requests_sent += pool.num_requests
+            connections_opened += pool.num_connections
+
+        return {
+            "requests": requests_sent,
+            "connections": connections_opened,
+            "reused": max(requests_sent - connections_opened, 0),
+        }
+
+    def close(self):
+        """Close the session and release all pooled connections."""
+
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=False, cancel_futures=True)
+            self._refresher = None
+        self.session.close()
+
+    def refresh_in_background(self, key: t.Hashable, func: t.Callable):
+        """
+        Refresh a stale cache entry on a background worker, once per key at a time.
+
+        Failures are dropped; the stale entry stays in the cache and the next call
+        tries again.
+
+        :param key: Key identifying the refresh, shared with identical foreground requests.
+        :param func: Callable that fetches the response and updates the cache.
+        """
+
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="octosuite-refresh"
+                )
+
+        def refresh():
+            try:
+                self.inflight.do(key=key, func=func)
+            except (requests.RequestException, RateLimitError, ValueError):
+                pass
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(refresh)
 
     def get(
         self,
@@ -39,6 +278,9 @@ class GitHub:
         params: t.Optional[dict] = None,
         return_response: bool = False,
         use_cache: bool = True,
+        revalidate: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+        raise_for_status: bool = False,
     ) -> t.Union[dict, list, Response]:
         """
         Make a GET request to the GitHub API.
@@ -47,94 +289,517 @@ class GitHub:
         :param params: Optional query parameters for the request.
         :param return_response: If True, return the raw Response object instead of JSON data.
         :param use_cache: If True, use cached responses when available.
+        :param revalidate: If True, ask GitHub whether a cached response is still current
+            (If-None-Match/If-Modified-Since) instead of serving it blindly. A 304 reply
+            reuses the cached body and does not count against the rate limit.
+        :param fields: Optional top-level fields to keep (in each item, for lists),
+            dropping the rest before the response is cached.
+        :param raise_for_status: If True, raise for an error reply instead of returning
+            an empty list.
         :return: Dictionary, list, or Response object depending on the request and parameters.
+        :raises requests.HTTPError: If raise_for_status is set and GitHub answers with an error.
         """
 
         if use_cache and not return_response:
-            cached = self.cache.get(url, params)
-            if cached is not None:
-                return cached
-
-        response = requests.get(
-            url=url, params=params, headers={"User-Agent": self.user_agent}
-        )
+            cache_params = self.cache_params(params, fields)
+            # Expired entries are still handed to _fetch so that they get revalidated
+            entry = self.cache.get_entry(url, cache_params, allow_stale=True)
+            key = self.cache.key(url, cache_params)
+            fetch = functools.partial(
+                self._fetch,
+                url=url,
+                params=params,
+                entry=entry,
+                fields=fields,
+                raise_for_status=raise_for_status,
+            )
+
+            if entry is not None and not revalidate:
+                if entry.is_fresh:
+                    self.remember_page(
+                        url=url,
+                        data=entry.data,
+                        params=params,
+                        fields=fields,
+                        expires_at=entry.expires_at,
+                    )
+                    return entry.data
+                if self.stale_while_revalidate:
+                    self.refresh_in_background(key=key, func=fetch)
+                    return entry.data
+
+            # Identical requests already on their way share that request's result
+            return self.inflight.do(key=key, func=fetch)
+
+        response = self.request(url=url, params=params)
 
         if return_response:
             return response
 
         if response.status_code == 200:
-            sanitised = self.sanitise_response(response=response.json())
+            return self.sanitise_response(
+                response=codec.loads(response.content), fields=fields
+            )
+
+        if raise_for_status:
+            response.raise_for_status()
+        return []
+
+    def _fetch(
+        self,
+        url: str,
+        params: t.Optional[dict],
+        entry: t.Optional[CacheEntry],
+        fields: t.Optional[t.Sequence[str]] = None,
+        raise_for_status: bool = False,
+    ) -> t.Union[dict, list]:
+        """
+        Fetch a response and cache it, revalidating the existing cache entry if there is one.
+
+        :param url: The API endpoint URL.
+        :param params: Optional query parameters for the request.
+        :param entry: The current cache entry for the request, if any.
+        :param fields: Optional top-level fields to keep, dropping the rest.
+        :param raise_for_status: If True, raise for an error reply instead of returning
+            an empty list.
+        :return: The sanitised response data, or an empty list if the request failed.
+        :raises requests.HTTPError: If raise_for_status is set and GitHub answers with an error.
+        """
 
-            # Cache the successful response
-            if use_cache:
-                self.cache.set(url, sanitised, params)
+        response = self.request(
+            url=url,
+            params=params,
+            headers=entry.validators() if entry is not None else None,
+        )
 
-            return sanitised
+        if response.status_code == 304 and entry is not None:
+            # Still current, so start its time to live over
+            self.cache.set(
+                url,
+                entry.data,
+                self.cache_params(params, fields),
+                etag=response.headers.get("ETag", entry.etag),
+                last_modified=response.headers.get(
+                    "Last-Modified", entry.last_modified
+                ),
+                size=entry.size,
+            )
+            self.remember_page(url=url, data=entry.data, params=params, fields=fields)
+            return entry.data
 
+        if response.status_code == 200:
+            return self.cache_response(
+                url=url, response=response, params=params, fields=fields
+            )
+
+        if raise_for_status:
+            response.raise_for_status()
         return []
 
-    def is_valid_entity(
-        self, _type: t.Literal["user", "org", "repo"], **kwargs
-    ) -> bool:
+    def paginate(
+        self,
+        url: str,
+        params: dict,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
         """
-        Validate whether a GitHub entity exists.
+        Fetch one page of a paginated endpoint, or every page from the requested one onwards.
 
-        :param _type: Type of entity to validate ("user", "org", or "repo").
-        :param kwargs: Entity identifiers (username for user/org, repo_owner and repo_name for repo).
-        :return: True if the entity exists, False otherwise.
+        In all-pages mode the page count is read from the `Link: rel="last"` header of
+        the first response, the remaining pages are fetched concurrently on a bounded
+        worker pool, and the results are merged in page order. Every page, the first
+        one included, is answered from the cache when it holds a fresh copy.
+
+        :param url: The API endpoint URL.
+        :param params: Query parameters, including 'page' and 'per_page'.
+        :param all_pages: If True, fetch every page from params['page'] onwards.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: List of items, or for search endpoints a dictionary with the merged 'items'.
+        :raises requests.HTTPError: If a page after the first cannot be fetched in
+            all-pages mode, rather than merging the others without it.
         """
 
-        try:
-            type_map = {
-                "user": f"https://api.github.com/users/{kwargs.get('username')}",
-                "org": f"https://api.github.com/orgs/{kwargs.get('username')}",
-                "repo": f"https://api.github.com/repos/{kwargs.get('repo_owner')}/{kwargs.get('repo_name')}",
-            }
+        if not all_pages:
+            return self.fetch_window(url=url, params=params, fields=fields)
+
+        # The first page comes from the cache too when its page count is known
+        cache_params = self.cache_params(params, fields)
+        key = self.cache.key(url, cache_params)
+        entry = self.cache.get_entry(url, cache_params)
+        last = self._last_pages.get(key)
+        if entry is not None and last is not None:
+            first_page = entry.data
+        else:
+            response = self.request(url=url, params=params)
+            if response.status_code != 200:
+                return []
+
+            first_page = self.cache_response(
+                url=url, response=response, params=params, fields=fields
+            )
+            last = self.last_page(response)
+            with self._last_pages_lock:
+                self._last_pages[key] = last
+                while len(self._last_pages) > self.MAX_LAST_PAGES:
+                    self._last_pages.popitem(last=False)
+
+        start = int(params.get("page", 1))
+        if last <= start:
+            return first_page
+
+        pages = range(start + 1, last + 1)
+        with ThreadPoolExecutor(
+            max_workers=min(self.page_workers, len(pages)),
+            thread_name_prefix="octosuite-pages",
+        ) as pool:
+            # map() yields results in submission order, i.e. page order
+            # A page that cannot be fetched fails the whole run instead of leaving a gap
+            rest = pool.map(
+                lambda page: self.get(
+                    url=url,
+                    params={**params, "page": page},
+                    fields=fields,
+                    raise_for_status=True,
+                ),
+                pages,
+            )
+            return self.merge_pages([first_page, *rest])
+
+    def fetch_window(
+        self,
+        url: str,
+        params: dict,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Fetch one page of a list endpoint, reusing items cached from other page sizes.
 
-            url = type_map[_type]
+        Items of earlier pages are remembered by their offset in the collection, so a
+        window they cover is answered without a request. A partly covered window only
+        fetches the missing items, plus one cached item on either side to check that
+        the list did not shift, on the smallest page that covers them.
 
-            # Check cache first
-            cached = self.cache.get(url)
-            if cached is not None:
-                return True  # If cached, entity exists
+        :param url: The API endpoint URL.
+        :param params: Query parameters, including 'page' and 'per_page'.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: List of items, or for search endpoints the response dictionary.
+        """
 
-            response = requests.get(url=url, headers={"User-Agent": self.user_agent})
+        paging = self.paging(url=url, params=params, fields=fields)
+        if paging is not None:
+            key, page, per_page = paging
+            collections = self.cache.collections
+            missing = collections.missing(key=key, page=page, per_page=per_page)
+
+            # Nothing of the window is cached when the whole window is missing. The
+            # pages fetched for a partly cached one overlap the cached items by one on
+            # each side, so the collection notices if the list shifted in between.
+            if missing != ((page - 1) * per_page, page * per_page):
+                if missing is not None:
+                    start, stop = missing
+                    for number, size in plan_pages(max(start - 1, 0), stop + 1):
+                        self.get(
+                            url=url,
+                            params={**params, "page": number, "per_page": size},
+                            fields=fields,
+                        )
+                window = collections.window(key=key, page=page, per_page=per_page)
+                if window is not None:
+                    return window
+
+        return self.get(url=url, params=params, fields=fields)
+
+    def paging(
+        self,
+        url: str,
+        params: t.Optional[dict] = None,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Optional[tuple[CacheKey, int, int]]:
+        """
+        Work out which collection and window a paginated request asks for.
 
-            # Only cache if entity exists (status 200)
-            if response.status_code == 200:
-                sanitised = self.sanitise_response(response.json())
-                self.cache.set(url, sanitised)
-                return True
+        :param url: The request URL, possibly with the page in its query string.
+        :param params: Optional query parameters for the request.
+        :param fields: Optional top-level fields kept in each item.
+        :return: Tuple of (collection key, page, per_page), or None if the request does
+            not ask for a page.
+        """
 
-            return False
-        except requests.RequestException:
-            return False
+        base, _, query = url.partition("?")
+        params = {**dict(parse_qsl(query)), **(params or {})}
+        if "page" not in params and "per_page" not in params:
+            return None
 
-    def sanitise_response(self, response: t.Union[dict, list]) -> t.Union[dict, list]:
+        # GitHub's default page size applies when only the page is given
+        page = int(params.pop("page", 1))
+        per_page = int(params.pop("per_page", 30))
+        key = self.cache.key(base, self.cache_params(params, fields))
+        return key, page, per_page
+
+    def remember_page(
+        self,
+        url: str,
+        data: t.Union[dict, list],
+        params: t.Optional[dict] = None,
+        fields: t.Optional[t.Sequence[str]] = None,
+        expires_at: t.Optional[float] = None,
+    ):
+        """
+        Index the items of a fetched or cached list page in the collection cache.
+
+        :param url: The URL the page was fetched from.
+        :param data: The sanitised page.
+        :param params: Optional query parameters used in the request.
+        :param fields: Optional top-level fields kept in each item.
+        :param expires_at: When the page goes stale, for pages answered from the
+            response cache; worked out from the TTL policy if not given.
         """
-        Remove API URLs and null values from response data recursively.
 
-        :param response: The response data to sanitise (dict or list).
-        :return: Sanitised response with API URLs and null values removed.
+        if not isinstance(data, list):
+            return
+        paging = self.paging(url=url, params=params, fields=fields)
+        if paging is None:
+            return
+
+        key, page, per_page = paging
+        if expires_at is None:
+            ttl = self.cache.policy.ttl_for(url, default=self.cache.ttl)
+            expires_at = None if ttl is None else time.time() + ttl
+        self.cache.collections.store(
+            key=key,
+            page=page,
+            per_page=per_page,
+            items=data,
+            page_key=self.cache.key(url, self.cache_params(params, fields)),
+            expires_at=expires_at,
+        )
+
+    def fetch_page(
+        self,
+        url: str,
+        params: t.Optional[dict] = None,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> tuple[list, t.Optional[str]]:
+        """
+        Fetch a single page of a paginated endpoint along with the link to the next one.
+
+        :param url: The page URL.
+        :param params: Optional query parameters for the request.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Tuple of (items, next_url) where next_url is None on the last page.
         """
 
-        pattern = re.compile(r"https://api\.github\.com")
+        response = self.request(url=url, params=params)
+        if response.status_code != 200:
+            return [], None
 
-        if isinstance(response, list):
-            return [self.sanitise_response(response=item) for item in response]
+        page = self.cache_response(
+            url=url, response=response, params=params, fields=fields
+        )
+        items = page.get("items", []) if isinstance(page, dict) else page
+        return items, response.links.get("next", {}).get("url")
+
+    def iter_pages(
+        self, url: str, params: dict, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the items of a paginated endpoint by following `Link: rel="next"`.
+
+        The next page is prefetched in the background while the caller works through
+        the current one, and only one page is held in memory at a time.
+
+        :param url: The API endpoint URL.
+        :param params: Query parameters for the first page, including 'page' and 'per_page'.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of items.
+        """
 
-        if isinstance(response, dict):
-            keys_to_remove = [
-                key
-                for key, value in response.items()
-                if (isinstance(value, str) and pattern.search(value)) or value is None
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="octosuite-prefetch"
+        ) as pool:
+            next_page = pool.submit(self.fetch_page, url, params, fields)
+            while next_page is not None:
+                items, next_url = next_page.result()
+                next_page = (
+                    pool.submit(self.fetch_page, next_url, None, fields)
+                    if next_url
+                    else None
+                )
+                yield from items
+
+    @staticmethod
+    def last_page(response: Response) -> int:
+        """
+        Read the last page number from a response's Link header.
+
+        :param response: The Response object of a paginated request.
+        :return: The last page number, or the current page if there is no rel="last" link.
+        """
+
+        last = response.links.get("last", {}).get("url")
+        if last is None:
+            current = parse_qs(urlparse(response.url).query).get("page", ["1"])
+            return int(current[0])
+
+        return int(parse_qs(urlparse(last).query).get("page", ["1"])[0])
+
+    @staticmethod
+    def merge_pages(pages: t.Iterable[t.Union[dict, list]]) -> t.Union[dict, list]:
+        """
+        Merge the pages of a paginated endpoint into a single result.
+
+        :param pages: Page results in page order.
+        :return: Concatenated list of items, or for search results the first page's
+            dictionary with every page's 'items' merged into it.
+        """
+
+        pages = list(pages)
+        first = pages[0]
+        if isinstance(first, dict):
+            items = [
+                item
+                for page in pages
+                if isinstance(page, dict)
+                for item in page.get("items", [])
             ]
-            for key in keys_to_remove:
-                response.pop(key)
+            return {**first, "items": items}
+
+        return [item for page in pages if isinstance(page, list) for item in page]
+
+    @staticmethod
+    def cache_params(
+        params: t.Optional[dict], fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Optional[dict]:
+        """
+        Build the parameters a response is cached under, which include any field projection.
 
-            # Recursively clean nested dicts/lists
-            for key, value in response.items():
-                if isinstance(value, (dict, list)):
-                    response[key] = self.sanitise_response(response=value)
+        :param params: Query parameters of the request.
+        :param fields: Optional fields the response was projected to.
+        :return: The parameters identifying the cache entry.
+        """
+
+        if not fields:
+            return params
+        return {**(params or {}), "fields": ",".join(fields)}
+
+    def cache_response(
+        self,
+        url: str,
+        response: Response,
+        params: t.Optional[dict] = None,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Sanitise a successful response and cache it along with its validators.
+
+        :param url: The URL the response was fetched from.
+        :param response: The successful Response object.
+        :param params: Optional query parameters used in the request.
+        :param fields: Optional top-level fields to keep, dropping the rest before caching.
+        :return: The sanitised response data, frozen (see core.frozen).
+        """
+
+        # Cached data is shared by every caller, so it is handed out read-only
+        sanitised = freeze(
+            self.sanitise_response(
+                response=codec.loads(response.content), fields=fields
+            )
+        )
+        self.cache.set(
+            url,
+            sanitised,
+            self.cache_params(params, fields),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            # The raw body bounds the size of the sanitised data unless fields were dropped
+            size=None if fields else len(response.content),
+        )
+        self.remember_page(url=url, data=sanitised, params=params, fields=fields)
+        return sanitised
+
+    def exists(self, url: str) -> tuple[bool, dict]:
+        """
+        Check whether the resource at a URL exists, caching it if it does.
+
+        :param url: The API endpoint URL of the resource.
+        :return: Tuple of (exists, response_data) where exists is True if the resource is found.
+        """
+
+        # Check cache first
+        entry = self.cache.get_entry(url, allow_stale=self.stale_while_revalidate)
+        if entry is not None:
+            if not entry.is_fresh:
+                self.refresh_in_background(
+                    key=self.cache.key(url, None),
+                    func=functools.partial(
+                        self._fetch, url=url, params=None, entry=entry
+                    ),
+                )
+            return True, entry.data
+
+        # Resources recently found missing are not asked for again until the entry expires
+        missing = self.cache.get_missing(url)
+        if missing is not None:
+            return False, missing.data
+
+        return self.inflight.do(
+            key=("exists", self.cache.key(url)),
+            func=lambda: self._check_exists(url=url),
+        )
+
+    def _check_exists(self, url: str) -> tuple[bool, dict]:
+        """
+        Request a resource to find out whether it exists, caching the answer either way.
+
+        :param url: The API endpoint URL of the resource.
+        :return: Tuple of (exists, response_data) where exists is True if the resource is found.
+        """
+
+        try:
+            response = self.request(url=url)
+
+            if response.status_code == 200:
+                return True, self.cache_response(url=url, response=response)
+
+            data = freeze(codec.loads(response.content))
+            if response.status_code in (404, 410):
+                self.cache.set_missing(url, data, status=response.status_code)
+            return False, data
+        except (requests.RequestException, ValueError):
+            return False, {}
+
+    def is_valid_entity(
+        self, _type: t.Literal["user", "org", "repo"], **kwargs
+    ) -> bool:
+        """
+        Validate whether a GitHub entity exists.
+
+        :param _type: Type of entity to validate ("user", "org", or "repo").
+        :param kwargs: Entity identifiers (username for user/org, repo_owner and repo_name for repo).
+        :return: True if the entity exists, False otherwise.
+        """
+
+        type_map = {
+            "user": f"{self.base_url}/users/{kwargs.get('username')}",
+            "org": f"{self.base_url}/orgs/{kwargs.get('username')}",
+            "repo": f"{self.base_url}/repos/{kwargs.get('repo_owner')}/{kwargs.get('repo_name')}",
+        }
+
+        exists, _ = self.exists(url=type_map[_type])
+        return exists
+
+    def sanitise_response(
+        self,
+        response: t.Union[dict, list],
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Remove API URLs and null values from response data.
+
+        :param response: The response data to sanitise (dict or list).
+        :param fields: Optional top-level fields to keep (in each item, for lists).
+        :return: Sanitised response with API URLs and null values removed.
+        """
 
-        return response
+        return self.sanitiser.sanitise(response, fields=fields)
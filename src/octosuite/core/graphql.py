@@ -0,0 +1,430 @@
+import typing as t
+from collections import deque
+
+from requests import RequestException
+
+from . import codec
+from .frozen import freeze
+from .github import GitHub
+from .models import github, Org, Repo, User
+
+__all__ = ["GraphQLResolver", "GraphQLError"]
+
+
+class GraphQLError(RequestException):
+    """Raised when GitHub rejects a GraphQL query as a whole."""
+
+
+# Selections for each kind of lookup, with the REST profile field every value maps to
+_USER_FIELDS = """
+    login databaseId id avatarUrl url isSiteAdmin name company websiteUrl location
+    email isHireable bio twitterUsername createdAt updatedAt
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    gists(privacy: PUBLIC) { totalCount }
+    followers { totalCount }
+    following { totalCount }
+"""
+
+_ORG_FIELDS = """
+    login databaseId id avatarUrl url name websiteUrl location email twitterUsername
+    isVerified description createdAt updatedAt
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+"""
+
+_REPO_FIELDS = """
+    databaseId id name nameWithOwner isPrivate url description isFork createdAt
+    updatedAt pushedAt homepageUrl diskUsage stargazerCount forkCount isArchived
+    isDisabled isTemplate mirrorUrl visibility hasIssuesEnabled hasWikiEnabled
+    hasProjectsEnabled hasDiscussionsEnabled
+    owner { __typename login id avatarUrl url ... on User { databaseId } ... on Organization { databaseId } }
+    primaryLanguage { name }
+    licenseInfo { key name spdxId }
+    defaultBranchRef { name }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    watchers { totalCount }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+"""
+
+
+def _count(node: dict, field: str) -> t.Optional[int]:
+    """Read the totalCount of a connection, if it was returned."""
+
+    connection = node.get(field)
+    return connection.get("totalCount") if connection else None
+
+
+def _user_profile(node: dict) -> dict:
+    """Reshape a GraphQL User into the REST /users/{login} shape."""
+
+    return {
+        "login": node.get("login"),
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "avatar_url": node.get("avatarUrl"),
+        "html_url": node.get("url"),
+        "type": "User",
+        "site_admin": node.get("isSiteAdmin"),
+        "name": node.get("name"),
+        "company": node.get("company"),
+        "blog": node.get("websiteUrl"),
+        "location": node.get("location"),
+        "email": node.get("email") or None,
+        "hireable": node.get("isHireable"),
+        "bio": node.get("bio"),
+        "twitter_username": node.get("twitterUsername"),
+        "public_repos": _count(node, "repositories"),
+        "public_gists": _count(node, "gists"),
+        "followers": _count(node, "followers"),
+        "following": _count(node, "following"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+    }
+
+
+def _org_profile(node: dict) -> dict:
+    """Reshape a GraphQL Organization into the REST /orgs/{org} shape."""
+
+    return {
+        "login": node.get("login"),
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "avatar_url": node.get("avatarUrl"),
+        "html_url": node.get("url"),
+        "type": "Organization",
+        "name": node.get("name"),
+        "blog": node.get("websiteUrl"),
+        "location": node.get("location"),
+        "email": node.get("email") or None,
+        "twitter_username": node.get("twitterUsername"),
+        "is_verified": node.get("isVerified"),
+        "description": node.get("description"),
+        "public_repos": _count(node, "repositories"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+    }
+
+
+def _repo_profile(node: dict) -> dict:
+    """Reshape a GraphQL Repository into the REST /repos/{owner}/{repo} shape."""
+
+    owner = node.get("owner") or {}
+    language = node.get("primaryLanguage") or {}
+    licence = node.get("licenseInfo")
+    branch = node.get("defaultBranchRef") or {}
+    topics = (node.get("repositoryTopics") or {}).get("nodes") or []
+    stars = node.get("stargazerCount")
+    forks = node.get("forkCount")
+    # Like REST, count open pull requests as open issues
+    open_issues = (_count(node, "issues") or 0) + (_count(node, "pullRequests") or 0)
+    visibility = node.get("visibility")
+
+    return {
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "name": node.get("name"),
+        "full_name": node.get("nameWithOwner"),
+        "private": node.get("isPrivate"),
+        "owner": {
+            "login": owner.get("login"),
+            "id": owner.get("databaseId"),
+            "node_id": owner.get("id"),
+            "avatar_url": owner.get("avatarUrl"),
+            "html_url": owner.get("url"),
+            "type": owner.get("__typename"),
+        },
+        "html_url": node.get("url"),
+        "description": node.get("description"),
+        "fork": node.get("isFork"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "pushed_at": node.get("pushedAt"),
+        "homepage": node.get("homepageUrl") or None,
+        "size": node.get("diskUsage"),
+        "stargazers_count": stars,
+        "watchers_count": stars,
+        "language": language.get("name"),
+        "has_issues": node.get("hasIssuesEnabled"),
+        "has_projects": node.get("hasProjectsEnabled"),
+        "has_wiki": node.get("hasWikiEnabled"),
+        "has_discussions": node.get("hasDiscussionsEnabled"),
+        "forks_count": forks,
+        "mirror_url": node.get("mirrorUrl"),
+        "archived": node.get("isArchived"),
+        "disabled": node.get("isDisabled"),
+        "open_issues_count": open_issues,
+        "license": (
+            {
+                "key": licence.get("key"),
+                "name": licence.get("name"),
+                "spdx_id": licence.get("spdxId"),
+            }
+            if licence
+            else None
+        ),
+        "is_template": node.get("isTemplate"),
+        "topics": [item["topic"]["name"] for item in topics if item.get("topic")],
+        "visibility": visibility.lower() if visibility else None,
+        "forks": forks,
+        "open_issues": open_issues,
+        "watchers": stars,
+        "default_branch": branch.get("name"),
+        "subscribers_count": _count(node, "watchers"),
+    }
+
+
+class GraphQLResolver:
+    """
+    Looks up many user, organisation or repository profiles with a few GraphQL queries.
+
+    Lookups are packed into aliased queries, each kept under a node budget, and the
+    results are reshaped into the keys User.profile(), Org.profile() and Repo.profile()
+    use; REST-only fields such as clone_url or parent are not included. The profiles
+    are cached apart from the REST responses. Organisations and repositories GitHub
+    reports as not found are cached as negative entries of their REST URLs, so
+    exists() and many() answer for them without a request; missing users are only
+    remembered by the resolver, as /users/{login} also finds organisations.
+
+    GitHub only answers GraphQL queries sent with a token.
+    """
+
+    # kind: (query field, arguments, selection, entity class, reshaper, nodes per lookup)
+    KINDS = {
+        "user": ("user", ("login",), _USER_FIELDS, User, _user_profile, 1),
+        "org": ("organization", ("login",), _ORG_FIELDS, Org, _org_profile, 1),
+        "repo": (
+            "repository",
+            ("owner", "name"),
+            _REPO_FIELDS,
+            Repo,
+            _repo_profile,
+            21,
+        ),
+    }
+
+    # Cache parameter keeping the reduced GraphQL profiles apart from REST responses
+    CACHE_PARAMS = {"via": "graphql"}
+
+    # Kinds whose NOT_FOUND means their REST URL answers 404 too. GraphQL's `user`
+    # field does not resolve organisations, while /users/{login} does.
+    REST_MISSING = frozenset({"org", "repo"})
+
+    # Errors that mean the query asked for too much at once and should be split
+    SPLIT_ERRORS = frozenset({"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED"})
+
+    def __init__(
+        self,
+        client: t.Optional[GitHub] = None,
+        endpoint: t.Optional[str] = None,
+        max_nodes: int = 1000,
+        max_aliases: int = 100,
+    ):
+        """
+        Initialise the GraphQLResolver.
+
+        :param client: Optional client to use instead of the shared module-level one.
+        :param endpoint: URL of the GraphQL API, derived from the client's base URL if not
+            given (/api/graphql for GitHub Enterprise, /graphql otherwise).
+        :param max_nodes: Largest number of nodes a single query may ask for.
+        :param max_aliases: Largest number of lookups packed into a single query.
+        """
+
+        client = client or github
+        self.client = client
+        if endpoint is None:
+            base_url = client.base_url
+            if base_url.endswith("/api/v3"):
+                endpoint = f"{base_url[:-len('/v3')]}/graphql"
+            else:
+                endpoint = f"{base_url}/graphql"
+        self.endpoint = endpoint
+        self.max_nodes = max_nodes
+        self.max_aliases = max_aliases
+        self.queries = 0
+        self.failed: dict[str, str] = {}
+
+    def query(self, query: str, variables: t.Optional[dict] = None) -> dict:
+        """
+        Send a GraphQL query.
+
+        :param query: The GraphQL document.
+        :param variables: Optional values for the query's variables.
+        :return: The decoded response, with 'data' and possibly 'errors'.
+        :raises GraphQLError: If GitHub answers with anything but a JSON document.
+        """
+
+        response = self.client.request(
+            url=self.endpoint,
+            method="POST",
+            json={"query": query, "variables": variables or {}},
+        )
+        self.queries += 1
+        try:
+            result = codec.loads(response.content)
+        except ValueError as error:
+            raise GraphQLError(
+                f"GraphQL query failed with HTTP {response.status_code}",
+                response=response,
+            ) from error
+        if not response.ok and not result.get("errors"):
+            raise GraphQLError(
+                result.get("message", f"HTTP {response.status_code}"),
+                response=response,
+            )
+        return result
+
+    def _build(self, kind: str, batch: list[tuple[str, ...]]) -> tuple[str, dict]:
+        """
+        Build an aliased query looking up a batch of entities.
+
+        :param kind: "user", "org" or "repo".
+        :param batch: Argument tuples, e.g. (login,) or (owner, name).
+        :return: Tuple of (query, variables).
+        """
+
+        field, arguments, selection, *_ = self.KINDS[kind]
+        declarations, lookups, variables = [], [], {}
+        for number, values in enumerate(batch):
+            bound = []
+            for argument, value in zip(arguments, values):
+                variable = f"{argument}{number}"
+                declarations.append(f"${variable}: String!")
+                bound.append(f"{argument}: ${variable}")
+                variables[variable] = value
+            lookups.append(f"e{number}: {field}({', '.join(bound)}) {{ ...fields }}")
+
+        query = (
+            f"query({', '.join(declarations)}) {{\n  "
+            + "\n  ".join(lookups)
+            + f"\n}}\nfragment fields on {field[0].upper()}{field[1:]} {{{selection}}}"
+        )
+        return query, variables
+
+    def resolve(
+        self, kind: t.Literal["user", "org", "repo"], identifiers: t.Iterable[str]
+    ) -> dict[str, t.Optional[dict]]:
+        """
+        Look up many entities of one kind.
+
+        Identifiers GitHub returns no data for without saying they do not exist, e.g.
+        for lack of permission or a timeout, are left out of the result and listed in
+        `failed` with the reason.
+
+        :param kind: "user", "org" or "repo".
+        :param identifiers: Logins, or "owner/name" for repositories.
+        :return: Dictionary mapping identifiers to their profile, or None if the entity
+            does not exist or the identifier is malformed.
+        :raises GraphQLError: If GitHub rejects a query that cannot be split any further.
+        """
+
+        _, arguments, _, entity_class, reshape, nodes = self.KINDS[kind]
+        cache = self.client.cache
+        self.failed = {}
+
+        results: dict[str, t.Optional[dict]] = {}
+        # (identifier, REST URL, query arguments) of the entities to look up
+        wanted: list[tuple[str, str, tuple[str, ...]]] = []
+        for identifier in dict.fromkeys(identifiers):
+            try:
+                entity = entity_class.from_identifier(identifier, client=self.client)
+            except ValueError:
+                results[identifier] = None
+                continue
+            if isinstance(entity, Repo):
+                values = (entity.owner, entity.name)
+            elif "/" in entity.name:
+                results[identifier] = None
+                continue
+            else:
+                values = (entity.name,)
+
+            cached = cache.get(entity.endpoint, self.CACHE_PARAMS)
+            if cached is not None:
+                results[identifier] = cached
+            elif (
+                cache.get_missing(entity.endpoint) is not None
+                or cache.get_missing(entity.endpoint, self.CACHE_PARAMS) is not None
+            ):
+                results[identifier] = None
+            else:
+                wanted.append((identifier, entity.endpoint, values))
+
+        size = max(1, min(self.max_aliases, self.max_nodes // nodes))
+        batches = deque(
+            wanted[start : start + size] for start in range(0, len(wanted), size)
+        )
+        while batches:
+            batch = batches.popleft()
+            query, variables = self._build(kind, [values for *_, values in batch])
+            result = self.query(query, variables)
+
+            errors = result.get("errors") or []
+            if result.get("data") is None:
+                if len(batch) > 1 and any(
+                    error.get("type") in self.SPLIT_ERRORS for error in errors
+                ):
+                    middle = len(batch) // 2
+                    batches.extendleft([batch[middle:], batch[:middle]])
+                    continue
+                raise GraphQLError(
+                    "; ".join(error.get("message", "") for error in errors)
+                    or "GraphQL query returned no data"
+                )
+
+            # Errors point at the alias they belong to through the first element of their path
+            alias_errors = {
+                error["path"][0]: error for error in errors if error.get("path")
+            }
+            data = result["data"]
+            for number, (identifier, url, _) in enumerate(batch):
+                alias = f"e{number}"
+                node = data.get(alias)
+                if node is not None:
+                    profile = freeze(self.client.sanitise_response(reshape(node)))
+                    cache.set(url, profile, self.CACHE_PARAMS)
+                    results[identifier] = profile
+                    continue
+
+                error = alias_errors.get(alias, {})
+                if error.get("type") == "NOT_FOUND":
+                    results[identifier] = None
+                    cache.set_missing(
+                        url,
+                        {"message": "Not Found"},
+                        None if kind in self.REST_MISSING else self.CACHE_PARAMS,
+                    )
+                else:
+                    self.failed[identifier] = error.get("message", "No data returned")
+
+        return results
+
+    def users(self, logins: t.Iterable[str]) -> dict[str, t.Optional[dict]]:
+        """
+        Look up many user profiles, see resolve().
+
+        :param logins: GitHub usernames.
+        :return: Dictionary mapping every login to its profile, or None if it does not exist.
+        """
+
+        return self.resolve("user", logins)
+
+    def orgs(self, logins: t.Iterable[str]) -> dict[str, t.Optional[dict]]:
+        """
+        Look up many organisation profiles, see resolve().
+
+        :param logins: GitHub organisation names.
+        :return: Dictionary mapping every name to its profile, or None if it does not exist.
+        """
+
+        return self.resolve("org", logins)
+
+    def repos(self, full_names: t.Iterable[str]) -> dict[str, t.Optional[dict]]:
+        """
+        Look up many repository profiles, see resolve().
+
+        :param full_names: Repositories as "owner/name".
+        :return: Dictionary mapping every full name to its profile, or None if it does
+            not exist.
+        """
+
+        return self.resolve("repo", full_names)
@@ -1,23 +1,36 @@
-from requests import exceptions
+import abc
+import typing as t
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from .github import GitHub, BASE_URL
+from .follow import EventFollower
+from .github import GitHub
 
 github = GitHub()
 
 __all__ = ["User", "Org", "Repo", "Search"]
 
 
-class GitHubEntity:
+class GitHubEntity(abc.ABC):
     """
-    Base class for GitHub entities with common functionality."""
+    Abstract base class for GitHub entities with common functionality."""
 
-    def __init__(self, source: str):
+    # Client every query goes through, shared by all instances unless overridden
+    client: GitHub = github
+    # Follower follow_events() builds, matching the client's sync or async requests
+    follower: type[EventFollower] = EventFollower
+
+    def __init__(self, source: str, client: t.Optional[GitHub] = None):
         """
         Initialise a GitHub entity.
 
         :param source: The source identifier for the entity.
+        :param client: Optional client to use instead of the shared module-level one.
         """
 
+        if client is not None:
+            self.client = client
+
         self.endpoint = None
         self.source = source
 
@@ -27,116 +40,402 @@ class GitHubEntity:
 
         :return: Tuple of (exists, response_data) where exists is True if the entity is found.
         """
-        # Check cache first
-        cached = github.cache.get(self.endpoint)
-        if cached is not None:
-            return True, cached
 
-        try:
-            response = github.get(url=self.endpoint, return_response=True)
+        return self.client.exists(url=self.endpoint)
+
+    def follow_events(
+        self,
+        interval: t.Optional[float] = None,
+        include_existing: bool = True,
+        stream: str = "events",
+    ) -> EventFollower:
+        """
+        Tail the entity's public events, see EventFollower.
+
+        :param interval: Seconds between polls, never less than GitHub's X-Poll-Interval.
+        :param include_existing: If True, start with the events already in the stream.
+        :param stream: The event endpoint to follow, e.g. "received_events" for a user.
+        :return: EventFollower whose follow() yields new events and run() passes them
+            to a callback.
+        """
 
-            if response.status_code == 200:
-                data = response.json()
-                # Sanitise the data
-                sanitised = github.sanitise_response(data)
-                # Cache the sanitised response
-                github.cache.set(self.endpoint, sanitised)
-                return True, sanitised
+        return self.follower(
+            url=f"{self.endpoint}/{stream}",
+            client=self.client,
+            interval=interval,
+            include_existing=include_existing,
+        )
 
-            return False, response.json()
-        except exceptions.RequestException:
-            return False, {}
+    @classmethod
+    @abc.abstractmethod
+    def from_identifier(
+        cls, identifier: str, client: t.Optional[GitHub] = None
+    ) -> "GitHubEntity":
+        """
+        Create an entity from the string that identifies it on GitHub.
+
+        :param identifier: The entity's identifier, e.g. a login or "owner/name".
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: The entity.
+        :raises ValueError: If the identifier is malformed.
+        """
+
+    @classmethod
+    def many(
+        cls,
+        identifiers: t.Iterable[str],
+        concurrency: t.Optional[int] = None,
+        client: t.Optional[GitHub] = None,
+    ) -> t.Iterator[tuple[str, bool, dict]]:
+        """
+        Check many entities at once, yielding each result as soon as it is known.
+
+        Lookups run on up to `concurrency` workers and only that many identifiers are
+        read ahead, so huge or lazy iterables are fine. Entities already cached, or
+        recently found missing, are answered without a request or a worker.
+
+        :param identifiers: Identifiers of the entities, see from_identifier().
+        :param concurrency: Maximum number of lookups in flight at the same time, the
+            size of the client's connection pool if not given. A client whose pool is
+            smaller is used as it is, with a warning.
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: Iterator of (identifier, exists, profile) tuples in completion order.
+            Malformed identifiers are reported as not existing.
+        """
+
+        client = client or cls.client
+        concurrency = concurrency or client.pool_maxsize
+        if client.pool_maxsize < concurrency:
+            warnings.warn(
+                f"The client keeps {client.pool_maxsize} connections for {concurrency} "
+                f"concurrent lookups, the rest will open throwaway connections; "
+                f"call client.configure_pool(pool_maxsize={concurrency}) to keep them",
+                stacklevel=2,
+            )
+
+        def cached(identifier: str) -> t.Optional[tuple[str, bool, dict]]:
+            try:
+                endpoint = cls.from_identifier(identifier, client=client).endpoint
+            except ValueError:
+                return identifier, False, {}
+
+            profile = client.cache.get(endpoint)
+            if profile is not None:
+                return identifier, True, profile
+            missing = client.cache.get_missing(endpoint)
+            if missing is not None:
+                return identifier, False, missing.data
+            return None
+
+        def lookup(identifier: str) -> tuple[str, bool, dict]:
+            exists, profile = cls.from_identifier(identifier, client=client).exists()
+            return identifier, exists, profile
+
+        identifiers = iter(identifiers)
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="octosuite-many"
+        ) as pool:
+            pending = set()
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(pending) < concurrency:
+                        identifier = next(identifiers, None)
+                        if identifier is None:
+                            exhausted = True
+                            break
+
+                        result = cached(identifier)
+                        if result is not None:
+                            yield result
+                        else:
+                            pending.add(pool.submit(lookup, identifier))
+
+                    if not pending:
+                        return
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
 
 class User(GitHubEntity):
     """Represents a GitHub user with methods to query user data."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, client: t.Optional[GitHub] = None):
         """
         Initialise a User instance.
 
         :param name: The GitHub username.
+        :param client: Optional client to use instead of the shared module-level one.
         """
 
-        super().__init__(source=name)
+        super().__init__(source=name, client=client)
         self.name = name
-        self.endpoint = f"{BASE_URL}/users/{name}"
+        self.endpoint = f"{self.client.base_url}/users/{name}"
+
+    @classmethod
+    def from_identifier(
+        cls, identifier: str, client: t.Optional[GitHub] = None
+    ) -> "User":
+        """
+        Create a User from a username.
+
+        :param identifier: The GitHub username.
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: The User.
+        :raises ValueError: If the username is empty.
+        """
+
+        name = identifier.strip()
+        if not name:
+            raise ValueError("Empty username")
+        return cls(name=name, client=client)
 
-    def profile(self) -> dict:
+    def profile(self, fields: t.Optional[t.Sequence[str]] = None) -> dict:
         """
         Retrieve the user's profile information.
 
+        :param fields: Optional top-level fields to keep, dropping the rest.
         :return: Dictionary containing user profile data.
         """
 
-        profile = github.get(url=self.endpoint)
+        profile = self.client.get(url=self.endpoint, fields=fields)
         return profile
 
-    def repos(self, page: int, per_page: int) -> list:
+    def repos(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the user's public repositories.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of repository dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        repos = github.get(url=f"{self.endpoint}/repos", params=params)
+        repos = self.client.paginate(
+            url=f"{self.endpoint}/repos",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return repos
 
-    def subscriptions(self, page: int, per_page: int) -> list:
+    def iter_repos(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the user's public repositories, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of repository dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/repos", params=params, fields=fields
+        )
+
+    def subscriptions(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve repositories the user is subscribed to.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of repository subscription dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        subscriptions = github.get(url=f"{self.endpoint}/subscriptions", params=params)
+        subscriptions = self.client.paginate(
+            url=f"{self.endpoint}/subscriptions",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return subscriptions
 
-    def starred(self, page: int, per_page: int) -> list:
+    def iter_subscriptions(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over repositories the user is subscribed to, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of repository subscription dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/subscriptions", params=params, fields=fields
+        )
+
+    def starred(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve repositories the user has starred.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of starred repository dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        starred = github.get(url=f"{self.endpoint}/starred", params=params)
+        starred = self.client.paginate(
+            url=f"{self.endpoint}/starred",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return starred
 
-    def followers(self, page: int, per_page: int) -> list:
+    def iter_starred(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over repositories the user has starred, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of starred repository dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/starred", params=params, fields=fields
+        )
+
+    def followers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the user's followers.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of follower user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        users = github.get(url=f"{self.endpoint}/followers", params=params)
+        users = self.client.paginate(
+            url=f"{self.endpoint}/followers",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return users
 
-    def following(self, page: int, per_page: int) -> list:
+    def iter_followers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the user's followers, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of follower user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/followers", params=params, fields=fields
+        )
+
+    def following(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve users that this user is following.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of followed user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        users = github.get(url=f"{self.endpoint}/following", params=params)
+        users = self.client.paginate(
+            url=f"{self.endpoint}/following",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return users
 
+    def iter_following(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over users that this user is following, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of followed user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/following", params=params, fields=fields
+        )
+
     def follows(self, user: str) -> bool:
         """Check if this user follows another user.
 
@@ -145,255 +444,788 @@ class User(GitHubEntity):
         """
         ...
 
-    def orgs(self, page: int, per_page: int) -> list:
+    def orgs(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve organisations the user belongs to.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of organisation dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        orgs = github.get(url=f"{self.endpoint}/orgs", params=params)
+        orgs = self.client.paginate(
+            url=f"{self.endpoint}/orgs",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return orgs
 
-    def gists(self, page: int, per_page: int) -> list:
+    def iter_orgs(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over organisations the user belongs to, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of organisation dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/orgs", params=params, fields=fields
+        )
+
+    def gists(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the user's gists.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of gist dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        gists = github.get(url=f"{self.endpoint}/gists", params=params)
+        gists = self.client.paginate(
+            url=f"{self.endpoint}/gists",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return gists
 
-    def events(self, page: int, per_page: int) -> list:
+    def iter_gists(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the user's gists, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of gist dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/gists", params=params, fields=fields
+        )
+
+    def events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the user's public events.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of event dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        events = github.get(url=f"{self.endpoint}/events", params=params)
+        events = self.client.paginate(
+            url=f"{self.endpoint}/events",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return events
 
-    def received_events(self, page: int, per_page: int) -> list:
+    def iter_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the user's public events, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of event dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/events", params=params, fields=fields
+        )
+
+    def received_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve events received by the user.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of received event dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        received_events = github.get(
-            url=f"{self.endpoint}/received_events", params=params
+        received_events = self.client.paginate(
+            url=f"{self.endpoint}/received_events",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
         )
         return received_events
 
+    def iter_received_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over events received by the user, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of received event dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/received_events", params=params, fields=fields
+        )
+
 
 class Org(GitHubEntity):
     """Represents a GitHub organisation with methods to query organisation data."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, client: t.Optional[GitHub] = None):
         """
         Initialise an Org instance.
 
         :param name: The GitHub organisation name.
+        :param client: Optional client to use instead of the shared module-level one.
         """
 
-        super().__init__(source=name)
+        super().__init__(source=name, client=client)
         self.name = name
-        self.endpoint = f"{BASE_URL}/orgs/{name}"
+        self.endpoint = f"{self.client.base_url}/orgs/{name}"
+
+    @classmethod
+    def from_identifier(
+        cls, identifier: str, client: t.Optional[GitHub] = None
+    ) -> "Org":
+        """
+        Create an Org from an organisation name.
 
-    def profile(self) -> dict:
+        :param identifier: The GitHub organisation name.
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: The Org.
+        :raises ValueError: If the name is empty.
+        """
+
+        name = identifier.strip()
+        if not name:
+            raise ValueError("Empty organisation name")
+        return cls(name=name, client=client)
+
+    def profile(self, fields: t.Optional[t.Sequence[str]] = None) -> dict:
         """
         Retrieve the organisation's profile information.
 
+        :param fields: Optional top-level fields to keep, dropping the rest.
         :return: Dictionary containing organisation profile data.
         """
 
-        profile = github.get(url=self.endpoint)
+        profile = self.client.get(url=self.endpoint, fields=fields)
         return profile
 
-    def repos(self, page: int, per_page: int) -> list:
+    def repos(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the organisation's public repositories.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of repository dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        repos = github.get(url=f"{self.endpoint}/repos", params=params)
+        repos = self.client.paginate(
+            url=f"{self.endpoint}/repos",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return repos
 
-    def events(self, page: int, per_page: int) -> list:
+    def iter_repos(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the organisation's public repositories, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of repository dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/repos", params=params, fields=fields
+        )
+
+    def events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the organisation's public events.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of event dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        events = github.get(url=f"{self.endpoint}/events", params=params)
+        events = self.client.paginate(
+            url=f"{self.endpoint}/events",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return events
 
-    def hooks(self, page: int, per_page: int) -> list:
+    def iter_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the organisation's public events, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of event dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/events", params=params, fields=fields
+        )
+
+    def hooks(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the organisation's webhooks.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of webhook dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        hooks = github.get(url=f"{self.endpoint}/hooks", params=params)
+        hooks = self.client.paginate(
+            url=f"{self.endpoint}/hooks",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return hooks
 
-    def issues(self, page: int, per_page: int) -> list:
+    def iter_hooks(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the organisation's webhooks, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of webhook dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/hooks", params=params, fields=fields
+        )
+
+    def issues(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the organisation's issues.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of issue dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        issues = github.get(url=f"{self.endpoint}/issues", params=params)
+        issues = self.client.paginate(
+            url=f"{self.endpoint}/issues",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return issues
 
-    def members(self, page: int, per_page: int) -> list:
+    def iter_issues(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the organisation's issues, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of issue dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/issues", params=params, fields=fields
+        )
+
+    def members(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the organisation's public members.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of member user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        members = github.get(url=f"{self.endpoint}/members", params=params)
+        members = self.client.paginate(
+            url=f"{self.endpoint}/members",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return members
 
+    def iter_members(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the organisation's public members, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of member user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/members", params=params, fields=fields
+        )
+
 
 class Repo(GitHubEntity):
     """Represents a GitHub repository with methods to query repository data."""
 
-    def __init__(self, name: str, owner: str):
+    def __init__(self, name: str, owner: str, client: t.Optional[GitHub] = None):
         """
         Initialise a Repo instance.
 
         :param name: The repository name.
         :param owner: The repository owner's username.
+        :param client: Optional client to use instead of the shared module-level one.
         """
 
-        super().__init__(source=f"{owner}/{name}")
+        super().__init__(source=f"{owner}/{name}", client=client)
         self.name = name
         self.owner = owner
-        self.endpoint = f"{BASE_URL}/repos/{owner}/{name}"
+        self.endpoint = f"{self.client.base_url}/repos/{owner}/{name}"
+
+    @classmethod
+    def from_identifier(
+        cls, identifier: str, client: t.Optional[GitHub] = None
+    ) -> "Repo":
+        """
+        Create a Repo from its full name.
 
-    def profile(self) -> dict:
+        :param identifier: The repository as "owner/name".
+        :param client: Optional client to use instead of the shared module-level one.
+        :return: The Repo.
+        :raises ValueError: If the identifier is not of the form "owner/name".
+        """
+
+        owner, _, name = identifier.strip().partition("/")
+        if not owner or not name or "/" in name:
+            raise ValueError(f"Invalid repository {identifier!r}, expected owner/name")
+        return cls(name=name, owner=owner, client=client)
+
+    def profile(self, fields: t.Optional[t.Sequence[str]] = None) -> dict:
         """
         Retrieve the repository's information.
 
+        :param fields: Optional top-level fields to keep, dropping the rest.
         :return: Dictionary containing repository data.
         """
 
-        profile = github.get(url=self.endpoint)
+        profile = self.client.get(url=self.endpoint, fields=fields)
         return profile
 
-    def forks(self, page: int, per_page: int) -> list:
+    def forks(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's forks.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of fork repository dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        forks = github.get(url=f"{self.endpoint}/forks", params=params)
+        forks = self.client.paginate(
+            url=f"{self.endpoint}/forks",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return forks
 
-    def issue_events(self, page: int, per_page: int) -> list:
+    def iter_forks(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's forks, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of fork repository dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/forks", params=params, fields=fields
+        )
+
+    def issue_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's issue events.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of issue event dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        issue_events = github.get(url=f"{self.endpoint}/issue_events", params=params)
+        issue_events = self.client.paginate(
+            url=f"{self.endpoint}/issue_events",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return issue_events
 
-    def events(self, page: int, per_page: int) -> list:
+    def iter_issue_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's issue events, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of issue event dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/issue_events", params=params, fields=fields
+        )
+
+    def events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's events.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of event dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        events = github.get(url=f"{self.endpoint}/events", params=params)
+        events = self.client.paginate(
+            url=f"{self.endpoint}/events",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return events
 
-    def assignees(self, page: int, per_page: int) -> list:
+    def iter_events(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's events, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of event dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/events", params=params, fields=fields
+        )
+
+    def assignees(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's available assignees.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of assignee user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        assignees = github.get(url=f"{self.endpoint}/assignees", params=params)
+        assignees = self.client.paginate(
+            url=f"{self.endpoint}/assignees",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return assignees
 
-    def branches(self, page: int, per_page: int) -> list:
+    def iter_assignees(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's available assignees, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of assignee user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/assignees", params=params, fields=fields
+        )
+
+    def branches(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's branches.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of branch dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        branches = github.get(url=f"{self.endpoint}/branches", params=params)
+        branches = self.client.paginate(
+            url=f"{self.endpoint}/branches",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return branches
 
-    def tags(self, page: int, per_page: int) -> list:
+    def iter_branches(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's branches, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of branch dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/branches", params=params, fields=fields
+        )
+
+    def tags(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's tags.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of tag dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        tags = github.get(url=f"{self.endpoint}/tags", params=params)
+        tags = self.client.paginate(
+            url=f"{self.endpoint}/tags",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return tags
 
+    def iter_tags(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's tags, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of tag dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/tags", params=params, fields=fields
+        )
+
     def languages(self) -> dict:
         """
         Retrieve the programming languages used in the repository.
@@ -401,61 +1233,193 @@ class Repo(GitHubEntity):
         :return: Dictionary mapping language names to bytes of code.
         """
 
-        languages = github.get(url=f"{self.endpoint}/languages")
+        languages = self.client.get(url=f"{self.endpoint}/languages")
         return languages
 
-    def stargazers(self, page: int, per_page: int) -> list:
+    def stargazers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve users who have starred the repository.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of stargazer user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        stargazers = github.get(url=f"{self.endpoint}/stargazers", params=params)
+        stargazers = self.client.paginate(
+            url=f"{self.endpoint}/stargazers",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return stargazers
 
-    def subscribers(self, page: int, per_page: int) -> list:
+    def iter_stargazers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over users who have starred the repository, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of stargazer user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/stargazers", params=params, fields=fields
+        )
+
+    def subscribers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve users subscribed to the repository.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of subscriber user dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        subscribers = github.get(url=f"{self.endpoint}/subscribers", params=params)
+        subscribers = self.client.paginate(
+            url=f"{self.endpoint}/subscribers",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return subscribers
 
-    def commits(self, page: int, per_page: int) -> list:
+    def iter_subscribers(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over users subscribed to the repository, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of subscriber user dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/subscribers", params=params, fields=fields
+        )
+
+    def commits(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's commits.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of commit dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        commits = github.get(url=f"{self.endpoint}/commits", params=params)
+        commits = self.client.paginate(
+            url=f"{self.endpoint}/commits",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return commits
 
-    def comments(self, page: int, per_page: int) -> list:
+    def iter_commits(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's commits, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of commit dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/commits", params=params, fields=fields
+        )
+
+    def comments(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's commit comments.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of comment dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        comments = github.get(url=f"{self.endpoint}/comments", params=params)
+        comments = self.client.paginate(
+            url=f"{self.endpoint}/comments",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return comments
 
+    def iter_comments(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's commit comments, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of comment dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/comments", params=params, fields=fields
+        )
+
     def contents(self, path: str) -> list:
         """
         Retrieve the contents of a file or directory in the repository.
@@ -464,126 +1428,386 @@ class Repo(GitHubEntity):
         :return: List of content item dictionaries.
         """
 
-        contents = github.get(url=f"{self.endpoint}/contents/{path}")
+        contents = self.client.get(url=f"{self.endpoint}/contents/{path}")
         return contents
 
-    def issues(self, page: int, per_page: int) -> list:
+    def issues(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's issues.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of issue dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        issues = github.get(url=f"{self.endpoint}/issues", params=params)
+        issues = self.client.paginate(
+            url=f"{self.endpoint}/issues",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return issues
 
-    def releases(self, page: int, per_page: int) -> list:
+    def iter_issues(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's issues, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of issue dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/issues", params=params, fields=fields
+        )
+
+    def releases(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's releases.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of release dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        releases = github.get(url=f"{self.endpoint}/releases", params=params)
+        releases = self.client.paginate(
+            url=f"{self.endpoint}/releases",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return releases
 
-    def deployments(self, page: int, per_page: int) -> list:
+    def iter_releases(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's releases, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of release dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/releases", params=params, fields=fields
+        )
+
+    def deployments(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's deployments.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of deployment dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        deployments = github.get(url=f"{self.endpoint}/deployments", params=params)
+        deployments = self.client.paginate(
+            url=f"{self.endpoint}/deployments",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return deployments
 
-    def labels(self, page: int, per_page: int) -> list:
+    def iter_deployments(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's deployments, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of deployment dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/deployments", params=params, fields=fields
+        )
+
+    def labels(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        all_pages: bool = False,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> list:
         """
         Retrieve the repository's labels.
 
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param all_pages: If True, fetch every page from `page` onwards and merge them in page order.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
         :return: List of label dictionaries.
         """
 
         params = {"page": page, "per_page": per_page}
-        labels = github.get(url=f"{self.endpoint}/labels", params=params)
+        labels = self.client.paginate(
+            url=f"{self.endpoint}/labels",
+            params=params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return labels
 
+    def iter_labels(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over the repository's labels, one page at a time.
+
+        :param page: Page number to start from.
+        :param per_page: Number of results per page.
+        :param fields: Optional top-level fields to keep in each item, dropping the rest.
+        :return: Iterator of label dictionaries.
+        """
+
+        params = {"page": page, "per_page": per_page}
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/labels", params=params, fields=fields
+        )
+
 
 class Search:
     """Provides methods to search GitHub for various entity types."""
 
-    def __init__(self, query: str, page: int, per_page: int):
+    # Client every query goes through, shared by all instances unless overridden
+    client: GitHub = github
+
+    def __init__(
+        self,
+        query: str,
+        page: int,
+        per_page: int,
+        client: t.Optional[GitHub] = None,
+    ):
         """
         Initialise a Search instance.
 
         :param query: The search query string.
         :param page: Page number for pagination.
         :param per_page: Number of results per page.
+        :param client: Optional client to use instead of the shared module-level one.
         """
 
+        if client is not None:
+            self.client = client
+
         self.query = query
         self.page = page
         self.per_page = per_page
-        self.endpoint = f"{BASE_URL}/search"
+        self.endpoint = f"{self.client.base_url}/search"
         self.params = {"q": query, "page": page, "per_page": per_page}
 
-    def repos(self) -> list:
+    def repos(
+        self, all_pages: bool = False, fields: t.Optional[t.Sequence[str]] = None
+    ) -> list:
         """
         Search for repositories matching the query.
 
+        :param all_pages: If True, fetch every page from the search's page onwards and merge the results.
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
         :return: List of repository search result dictionaries.
         """
 
-        repos = github.get(url=f"{self.endpoint}/repositories", params=self.params)
+        repos = self.client.paginate(
+            url=f"{self.endpoint}/repositories",
+            params=self.params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return repos
 
-    def users(self) -> list:
+    def iter_repos(
+        self, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over repositories matching the query, one page at a time from the search's page onwards.
+
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
+        :return: Iterator of repository search result dictionaries.
+        """
+
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/repositories", params=self.params, fields=fields
+        )
+
+    def users(
+        self, all_pages: bool = False, fields: t.Optional[t.Sequence[str]] = None
+    ) -> list:
         """
         Search for users matching the query.
 
+        :param all_pages: If True, fetch every page from the search's page onwards and merge the results.
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
         :return: List of user search result dictionaries.
         """
 
-        users = github.get(url=f"{self.endpoint}/users", params=self.params)
+        users = self.client.paginate(
+            url=f"{self.endpoint}/users",
+            params=self.params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return users
 
-    def commits(self) -> list:
+    def iter_users(
+        self, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over users matching the query, one page at a time from the search's page onwards.
+
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
+        :return: Iterator of user search result dictionaries.
+        """
+
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/users", params=self.params, fields=fields
+        )
+
+    def commits(
+        self, all_pages: bool = False, fields: t.Optional[t.Sequence[str]] = None
+    ) -> list:
         """
         Search for commits matching the query.
 
+        :param all_pages: If True, fetch every page from the search's page onwards and merge the results.
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
         :return: List of commit search result dictionaries.
         """
 
-        commits = github.get(url=f"{self.endpoint}/commits", params=self.params)
+        commits = self.client.paginate(
+            url=f"{self.endpoint}/commits",
+            params=self.params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return commits
 
-    def issues(self) -> list:
+    def iter_commits(
+        self, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over commits matching the query, one page at a time from the search's page onwards.
+
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
+        :return: Iterator of commit search result dictionaries.
+        """
+
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/commits", params=self.params, fields=fields
+        )
+
+    def issues(
+        self, all_pages: bool = False, fields: t.Optional[t.Sequence[str]] = None
+    ) -> list:
         """
         Search for issues and pull requests matching the query.
 
+        :param all_pages: If True, fetch every page from the search's page onwards and merge the results.
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
         :return: List of issue search result dictionaries.
         """
 
-        issues = github.get(url=f"{self.endpoint}/issues", params=self.params)
+        issues = self.client.paginate(
+            url=f"{self.endpoint}/issues",
+            params=self.params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return issues
 
-    def topics(self) -> list:
+    def iter_issues(
+        self, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over issues and pull requests matching the query, one page at a time from the search's page onwards.
+
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
+        :return: Iterator of issue search result dictionaries.
+        """
+
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/issues", params=self.params, fields=fields
+        )
+
+    def topics(
+        self, all_pages: bool = False, fields: t.Optional[t.Sequence[str]] = None
+    ) -> list:
         """
         Search for topics matching the query.
 
+        :param all_pages: If True, fetch every page from the search's page onwards and merge the results.
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
         :return: List of topic search result dictionaries.
         """
 
-        topics = github.get(url=f"{self.endpoint}/topics", params=self.params)
+        topics = self.client.paginate(
+            url=f"{self.endpoint}/topics",
+            params=self.params,
+            all_pages=all_pages,
+            fields=fields,
+        )
         return topics
+
+    def iter_topics(
+        self, fields: t.Optional[t.Sequence[str]] = None
+    ) -> t.Iterator[dict]:
+        """
+        Lazily iterate over topics matching the query, one page at a time from the search's page onwards.
+
+        :param fields: Optional top-level fields to keep in each result, dropping the rest.
+        :return: Iterator of topic search result dictionaries.
+        """
+
+        return self.client.iter_pages(
+            url=f"{self.endpoint}/topics", params=self.params, fields=fields
+        )
@@ -0,0 +1,308 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+__all__ = ["CollectionCache", "plan_pages"]
+
+
+def plan_pages(start: int, stop: int, max_per_page: int = 100) -> list[tuple[int, int]]:
+    """
+    Work out which pages to request to cover a range of item offsets.
+
+    A single page is used whenever one of up to `max_per_page` items covers the whole
+    range, choosing the smallest such page; otherwise consecutive full-size pages are.
+
+    :param start: Offset of the first item needed.
+    :param stop: Offset just past the last item needed.
+    :param max_per_page: Largest page size the API accepts.
+    :return: List of (page, per_page) tuples.
+    """
+
+    for size in range(max(stop - start, 1), max_per_page + 1):
+        if start // size == (stop - 1) // size:
+            return [(start // size + 1, size)]
+
+    return [
+        (number + 1, max_per_page)
+        for number in range(start // max_per_page, (stop - 1) // max_per_page + 1)
+    ]
+
+
+def _identity(item: t.Any) -> t.Any:
+    """
+    Pick the value that identifies a list item, so that shifted pages can be detected.
+
+    :param item: An item of a paginated collection.
+    :return: Its id, SHA, node id, name or login, or None if it has none of them.
+    """
+
+    if isinstance(item, dict):
+        for field in ("id", "sha", "node_id", "name", "login"):
+            value = item.get(field)
+            if value is not None:
+                return value
+    return None
+
+
+class _Collection:
+    """
+    Where the items of one paginated collection are, by their absolute offset.
+
+    Every offset maps to (key of the cached page holding the item, index of the item
+    in that page, identity of the item), so the items themselves stay in the response
+    cache, inside its byte budget and compressed if it compresses.
+    """
+
+    __slots__ = ("refs", "offsets", "end", "expires_at")
+
+    def __init__(self, expires_at: t.Optional[float]):
+        self.refs: dict[int, tuple[t.Hashable, int, t.Any]] = {}
+        self.offsets: dict[t.Hashable, int] = {}
+        self.end: t.Optional[int] = None
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or time.time() < self.expires_at
+
+    def lines_up(self, start: int, items: list) -> bool:
+        """
+        Check that a page agrees with the items stored so far.
+
+        :param start: Offset of the page's first item.
+        :param items: The items of the page.
+        :return: False if an item is stored at another offset, or another item is
+            stored at the item's offset.
+        """
+
+        for offset, item in enumerate(items, start):
+            identity = _identity(item)
+            if identity is None:
+                continue
+            if self.offsets.get(identity, offset) != offset:
+                return False
+            if offset in self.refs and self.refs[offset][2] != identity:
+                return False
+        return True
+
+
+class CollectionCache:
+    """
+    Answers any (page, per_page) window of a paginated collection from pages fetched before.
+
+    Every page of a list endpoint that comes in is indexed by absolute item offset, so
+    `page=2, per_page=50` is served from an earlier `page=1, per_page=100` without a
+    request. A page shorter than requested marks the end of the collection. Only the
+    index is kept here: windows are assembled from the pages in the response cache,
+    and offsets whose page has been evicted count as missing again.
+    """
+
+    def __init__(
+        self,
+        load: t.Callable[[t.Hashable], t.Optional[list]],
+        max_collections: int = 256,
+    ):
+        """
+        Initialise the CollectionCache.
+
+        :param load: Returns the items of a cached page by its response cache key, or
+            None if the page is no longer cached.
+        :param max_collections: Number of collections to keep before evicting the least
+            recently used one.
+        """
+
+        self.load = load
+        self.max_collections = max_collections
+        self.window_hits = 0
+        self.partial_hits = 0
+        self.realigned = 0
+        self._collections: OrderedDict[t.Hashable, _Collection] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: t.Hashable) -> t.Optional[_Collection]:
+        """
+        Look up a fresh collection, dropping it if it has expired.
+
+        Must be called with the lock held.
+
+        :param key: Key of the collection.
+        :return: The collection, or None.
+        """
+
+        collection = self._collections.get(key)
+        if collection is None:
+            return None
+        if not collection.is_fresh:
+            del self._collections[key]
+            return None
+        self._collections.move_to_end(key)
+        return collection
+
+    def store(
+        self,
+        key: t.Hashable,
+        page: int,
+        per_page: int,
+        items: list,
+        page_key: t.Hashable,
+        expires_at: t.Optional[float] = None,
+    ):
+        """
+        Index the items of a fetched page.
+
+        If an item of the page is stored at another offset, or another item at its
+        offset, the collection changed since the other pages were fetched, so they are
+        dropped rather than combined with this one into windows that repeat or skip
+        items.
+
+        :param key: Key of the collection, i.e. the endpoint and its non-paging parameters.
+        :param page: The page number that was fetched.
+        :param per_page: The page size that was requested.
+        :param items: The items of the page.
+        :param page_key: Key the page is stored under in the response cache.
+        :param expires_at: Unix timestamp after which a new collection goes stale.
+        """
+
+        start = (page - 1) * per_page
+        with self._lock:
+            collection = self._get(key)
+            if collection is not None and not collection.lines_up(start, items):
+                self.realigned += 1
+                collection = None
+            if collection is None:
+                collection = self._collections[key] = _Collection(expires_at)
+                self._collections.move_to_end(key)
+                while len(self._collections) > self.max_collections:
+                    self._collections.popitem(last=False)
+
+            for index, item in enumerate(items):
+                identity = _identity(item)
+                collection.refs[start + index] = (page_key, index, identity)
+                if identity is not None:
+                    collection.offsets[identity] = start + index
+            if len(items) < per_page:
+                collection.end = start + len(items)
+
+    def missing(
+        self, key: t.Hashable, page: int, per_page: int
+    ) -> t.Optional[tuple[int, int]]:
+        """
+        Find the offsets of a window that are not indexed.
+
+        :param key: Key of the collection.
+        :param page: The page number of the window.
+        :param per_page: The page size of the window.
+        :return: Tuple of (start, stop) offsets spanning every missing item, or None if
+            the whole window is indexed.
+        """
+
+        start = (page - 1) * per_page
+        stop = start + per_page
+        with self._lock:
+            collection = self._get(key)
+            if collection is None:
+                return start, stop
+            if collection.end is not None:
+                stop = min(stop, collection.end)
+
+            absent = [
+                offset for offset in range(start, stop) if offset not in collection.refs
+            ]
+            if not absent:
+                return None
+            if len(absent) < stop - start:
+                self.partial_hits += 1
+            return absent[0], absent[-1] + 1
+
+    def window(self, key: t.Hashable, page: int, per_page: int) -> t.Optional[list]:
+        """
+        Assemble a window from cached pages.
+
+        :param key: Key of the collection.
+        :param page: The page number of the window.
+        :param per_page: The page size of the window.
+        :return: List of items, or None if part of the window is not cached.
+        """
+
+        start = (page - 1) * per_page
+        stop = start + per_page
+        with self._lock:
+            collection = self._get(key)
+            if collection is None:
+                return None
+            if collection.end is not None:
+                stop = min(stop, collection.end)
+            try:
+                refs = [collection.refs[offset] for offset in range(start, stop)]
+            except KeyError:
+                return None
+
+        # Pages are read outside the lock, each once however many items it holds
+        pages: dict[t.Hashable, t.Optional[list]] = {}
+        window = []
+        lost = set()
+        for offset, (page_key, index, identity) in enumerate(refs, start):
+            if page_key not in pages:
+                pages[page_key] = self.load(page_key)
+            items = pages[page_key]
+            if (
+                items is None
+                or index >= len(items)
+                or _identity(items[index]) != identity
+            ):
+                lost.add(page_key)
+                continue
+            window.append(items[index])
+
+        with self._lock:
+            if lost:
+                self._forget(key, lost)
+                return None
+            self.window_hits += 1
+        return window
+
+    def _forget(self, key: t.Hashable, page_keys: set):
+        """
+        Drop the offsets that point into pages no longer cached as they were indexed.
+
+        Must be called with the lock held.
+
+        :param key: Key of the collection.
+        :param page_keys: Keys of the pages to drop.
+        """
+
+        collection = self._collections.get(key)
+        if collection is None:
+            return
+        for offset, (page_key, _, identity) in list(collection.refs.items()):
+            if page_key in page_keys:
+                del collection.refs[offset]
+                if collection.offsets.get(identity) == offset:
+                    del collection.offsets[identity]
+
+    def clear(self):
+        """Forget every collection."""
+
+        with self._lock:
+            self._collections.clear()
+
+    def stats(self) -> dict:
+        """
+        Report how often windows were served from cached pages.
+
+        :return: Dictionary with the collection count, the number of indexed items,
+            window hits, partial hits and the number of collections dropped because
+            their pages no longer lined up.
+        """
+
+        with self._lock:
+            return {
+                "collections": len(self._collections),
+                "indexed_items": sum(
+                    len(collection.refs) for collection in self._collections.values()
+                ),
+                "window_hits": self.window_hits,
+                "partial_hits": self.partial_hits,
+                "realigned": self.realigned,
+            }
@@ -0,0 +1,332 @@
+import threading
+import time
+import typing as t
+from urllib.parse import urlparse
+
+from requests import Response
+
+__all__ = ["RateLimiter", "RateLimitBucket", "RateLimitError"]
+
+
+class RateLimitError(Exception):
+    """Raised when a rate limit is exhausted and the client is not allowed to wait it out."""
+
+    def __init__(self, resource: str, reset_at: float):
+        """
+        Initialise a RateLimitError.
+
+        :param resource: The rate limit resource that is exhausted ("core", "search", …).
+        :param reset_at: Unix timestamp at which the budget is expected to reset.
+        """
+
+        self.resource = resource
+        self.reset_at = reset_at
+        super().__init__(
+            f"GitHub {resource} rate limit exhausted, "
+            f"resets at {time.strftime('%H:%M:%S', time.localtime(reset_at))}"
+        )
+
+
+class RateLimitBucket:
+    """
+    Token bucket that paces requests against one GitHub rate limit resource.
+
+    Until GitHub reports a budget, requests are paced against the default allowance.
+    From then on the bucket holds the remaining budget GitHub reported, so requests go
+    out without delay until it is used up and then wait for the reset.
+    """
+
+    def __init__(self, resource: str, limit: int, window: float):
+        """
+        Initialise a RateLimitBucket.
+
+        :param resource: Name of the rate limit resource this bucket tracks.
+        :param limit: Number of requests allowed per window until GitHub reports otherwise.
+        :param window: Length of the rate limit window in seconds.
+        """
+
+        self.resource = resource
+        self.limit = limit
+        self.window = window
+        self.remaining: t.Optional[int] = None
+        self.reset_at: float = 0.0
+        # Cleared when the server answers without rate limit headers, e.g. a
+        # GitHub Enterprise instance with rate limiting turned off
+        self.enforced = True
+
+        self._tokens = float(limit)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+
+        # _lock guards the counters, _queue makes waiters on this bucket take turns
+        # without holding up callers of any other bucket. _changed wakes a waiter
+        # when a reply reports a new budget.
+        self._lock = threading.Lock()
+        self._queue = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def _delay(self) -> float:
+        """
+        Refill the bucket and work out how long until the next request may be sent.
+
+        Must be called with the state lock held.
+
+        :return: Number of seconds to wait, 0 if a request may go out now.
+        """
+
+        now = time.monotonic()
+        if self.remaining is None:
+            self._tokens = min(
+                self.limit,
+                self._tokens + (now - self._refilled_at) * self.limit / self.window,
+            )
+        self._refilled_at = now
+
+        blocked_for = self._blocked_until - time.time()
+        if blocked_for > 0:
+            return blocked_for
+
+        if self._tokens >= 1 or not self.enforced:
+            return 0.0
+
+        if self.remaining is None:
+            return (1 - self._tokens) * self.window / self.limit
+
+        # The reported budget is used up and comes back in full at the reset
+        reset_in = self.reset_at - time.time()
+        if reset_in > 0:
+            return reset_in
+        self.remaining = self.limit
+        self._tokens = float(self.limit)
+        return 0.0
+
+    def delay(self) -> float:
+        """
+        Work out how long until the bucket will hand out its next token.
+
+        :return: Number of seconds to wait, 0 if a request may go out now.
+        """
+
+        with self._lock:
+            return self._delay()
+
+    def available(self) -> int:
+        """
+        Estimate how many requests are left in the current window.
+
+        :return: The remaining budget reported by GitHub, or the limit if none was reported yet.
+        """
+
+        with self._lock:
+            return self.limit if self.remaining is None else self.remaining
+
+    def acquire(self, wait: bool = True, max_wait: t.Optional[float] = None):
+        """
+        Take a token from the bucket, waiting for one to become available if necessary.
+
+        :param wait: If False, raise instead of waiting when no token is available.
+        :param max_wait: Longest single wait in seconds that is acceptable, None for no limit.
+        :raises RateLimitError: If a token is not available and waiting is not allowed.
+        """
+
+        with self._queue, self._lock:
+            while True:
+                delay = self._delay()
+                if delay <= 0:
+                    self._tokens -= 1
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return
+
+                if not wait or (max_wait is not None and delay > max_wait):
+                    raise RateLimitError(
+                        resource=self.resource, reset_at=time.time() + delay
+                    )
+
+                self._changed.wait(delay)
+
+    def update(self, headers: t.Mapping[str, str]):
+        """
+        Synchronise the bucket with the X-RateLimit-* headers of a response.
+
+        :param headers: Response headers.
+        """
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        with self._lock:
+            self.enforced = True
+            limit = headers.get("X-RateLimit-Limit")
+            if limit:
+                self.limit = max(int(limit), 1)
+            self.remaining = int(remaining)
+            self.reset_at = float(headers.get("X-RateLimit-Reset", self.reset_at))
+            self._tokens = float(self.remaining)
+
+            if self.remaining <= 0:
+                self._blocked_until = max(self._blocked_until, self.reset_at)
+            self._changed.notify_all()
+
+    def block(self, seconds: float):
+        """
+        Stop handing out tokens for a while, e.g. after a secondary rate limit reply.
+
+        :param seconds: Number of seconds to hold requests back for.
+        """
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def resumes_at(self) -> float:
+        """
+        Work out when the bucket will let requests through again.
+
+        :return: Unix timestamp of the end of a block or, if the budget is used up,
+            of the reset; the current time otherwise.
+        """
+
+        with self._lock:
+            resume = max(self._blocked_until, time.time())
+            if self.remaining is not None and self.remaining <= 0:
+                resume = max(resume, self.reset_at)
+            return resume
+
+    def status(self) -> dict:
+        """
+        Report the bucket's current budget.
+
+        :return: Dictionary with the limit, remaining requests and reset time.
+        """
+
+        with self._lock:
+            return {
+                "enforced": self.enforced,
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset": self.reset_at,
+            }
+
+
+class RateLimiter:
+    """Tracks GitHub's core and search budgets separately and paces requests against them."""
+
+    # Unauthenticated defaults, corrected by the X-RateLimit-* headers of the first reply.
+    # Code search has a budget of its own, and GraphQL always needs a token and is
+    # budgeted in points rather than requests.
+    DEFAULT_LIMITS = {
+        "core": (60, 3600),
+        "search": (10, 60),
+        "code_search": (10, 60),
+        "graphql": (5000, 3600),
+    }
+
+    def __init__(self, wait: bool = True, max_wait: t.Optional[float] = 300):
+        """
+        Initialise the RateLimiter.
+
+        :param wait: If True, sleep until budget is available instead of raising RateLimitError.
+        :param max_wait: Longest single wait in seconds before giving up, None to always wait.
+        """
+
+        self.wait = wait
+        self.max_wait = max_wait
+        self.buckets = {
+            resource: RateLimitBucket(resource=resource, limit=limit, window=window)
+            for resource, (limit, window) in self.DEFAULT_LIMITS.items()
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        """
+        Work out which rate limit resource a URL is charged against.
+
+        :param url: The request URL.
+        :return: The resource name.
+        """
+
+        path = urlparse(url).path
+        if "/search/" in path:
+            return (
+                "code_search" if path.rstrip("/").endswith("/search/code") else "search"
+            )
+        if path.endswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    def bucket(self, resource: str) -> RateLimitBucket:
+        """
+        Get the bucket for a resource, creating it on first use.
+
+        :param resource: The rate limit resource name.
+        :return: The RateLimitBucket for the resource.
+        """
+
+        with self._lock:
+            if resource not in self.buckets:
+                limit, window = self.DEFAULT_LIMITS["core"]
+                self.buckets[resource] = RateLimitBucket(
+                    resource=resource, limit=limit, window=window
+                )
+            return self.buckets[resource]
+
+    def acquire(self, url: str):
+        """
+        Wait for budget to send a request to the given URL.
+
+        :param url: The request URL.
+        :raises RateLimitError: If the budget is exhausted and waiting is not allowed.
+        """
+
+        self.bucket(self.resource_for(url)).acquire(
+            wait=self.wait, max_wait=self.max_wait
+        )
+
+    def update(self, url: str, response: Response) -> bool:
+        """
+        Record the budget reported by a response and detect rate limit rejections.
+
+        :param url: The request URL.
+        :param response: The Response object.
+        :return: True if the request was rejected by a (primary or secondary)
+            rate limit and should be sent again.
+        """
+
+        # The bucket is picked from the path, like in acquire(), so that the budget
+        # recorded here is the one requests to this URL are paced against
+        bucket = self.bucket(self.resource_for(url))
+        bucket.update(response.headers)
+
+        if response.ok and "X-RateLimit-Remaining" not in response.headers:
+            bucket.enforced = False
+
+        if response.status_code not in (403, 429):
+            return False
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            bucket.block(float(retry_after))
+            return True
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+
+        # Secondary rate limits without Retry-After: GitHub asks for at least a minute
+        if "rate limit" in response.text.lower():
+            bucket.block(60)
+            return True
+
+        return False
+
+    def status(self) -> dict:
+        """
+        Report the budget of every tracked resource.
+
+        :return: Dictionary mapping resource names to their budget.
+        """
+
+        with self._lock:
+            buckets = list(self.buckets.values())
+        return {bucket.resource: bucket.status() for bucket in buckets}
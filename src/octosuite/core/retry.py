@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+import typing as t
+
+from requests import Response, exceptions
+
+__all__ = ["RetryPolicy", "CircuitBreaker", "CircuitOpenError", "RetriesExhaustedError"]
+
+
+class CircuitOpenError(exceptions.RequestException):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class RetriesExhaustedError(exceptions.HTTPError):
+    """Raised when GitHub still answers with a 5xx reply after every attempt."""
+
+
+class CircuitBreaker:
+    """Stops sending requests for a while after GitHub keeps failing in a row."""
+
+    def __init__(self, failure_threshold: int = 10, recovery_time: float = 30):
+        """
+        Initialise a CircuitBreaker.
+
+        :param failure_threshold: Consecutive failures after which the circuit opens.
+        :param recovery_time: Seconds to keep the circuit open before letting a trial
+            request through.
+        """
+
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: t.Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> t.Literal["closed", "open", "half-open"]:
+        """Current state of the circuit."""
+
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.recovery_time:
+                return "open"
+            return "half-open"
+
+    def check(self):
+        """
+        Make sure a request may be sent.
+
+        :raises CircuitOpenError: If the circuit is open.
+        """
+
+        if self.state == "open":
+            raise CircuitOpenError(
+                f"GitHub keeps failing, not sending requests for up to "
+                f"{self.recovery_time:.0f}s"
+            )
+
+    def record_success(self):
+        """Close the circuit after a request went through."""
+
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """Count a failed request, opening the circuit once the threshold is reached."""
+
+        with self._lock:
+            self.failures += 1
+            # A failed trial request in half-open state re-opens the circuit straight away
+            if self.failures >= self.failure_threshold or self._opened_at is not None:
+                if self._opened_at is None:
+                    self.trips += 1
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Decides when and how long to wait before replaying a failed request."""
+
+    # Transient failures worth replaying; every request octosuite sends is idempotent
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    RETRY_EXCEPTIONS = (
+        exceptions.ConnectionError,
+        exceptions.Timeout,
+        exceptions.ChunkedEncodingError,
+    )
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        breaker: t.Optional[CircuitBreaker] = None,
+    ):
+        """
+        Initialise a RetryPolicy.
+
+        :param attempts: Total number of times a request is sent before giving up.
+        :param backoff: Base delay in seconds, doubled after every failed attempt.
+        :param max_backoff: Upper bound in seconds for a single delay.
+        :param jitter: If True, pick a random delay up to the backoff ("full jitter")
+            so that parallel workers do not retry in lockstep.
+        :param breaker: CircuitBreaker shared by all requests of the client.
+        """
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.breaker = breaker or CircuitBreaker()
+        self.retries = 0
+        self.give_ups = 0
+        self._lock = threading.Lock()
+
+    def should_retry(
+        self,
+        attempt: int,
+        response: t.Optional[Response] = None,
+        error: t.Optional[Exception] = None,
+    ) -> bool:
+        """
+        Decide whether a failed attempt should be replayed, recording the outcome.
+
+        :param attempt: Zero-based number of the attempt that just finished.
+        :param response: The Response of the attempt, if one was received.
+        :param error: The exception raised by the attempt, if any.
+        :return: True if the request should be sent again.
+        """
+
+        if error is not None:
+            failed = isinstance(error, self.RETRY_EXCEPTIONS)
+        else:
+            failed = response.status_code in self.RETRY_STATUSES
+
+        if not failed:
+            if error is None:
+                self.breaker.record_success()
+            return False
+
+        self.breaker.record_failure()
+        with self._lock:
+            if attempt + 1 < self.attempts:
+                self.retries += 1
+                return True
+            self.give_ups += 1
+            return False
+
+    def give_up(self):
+        """Count a request that was abandoned for a reason outside this policy, e.g. rate limits."""
+
+        with self._lock:
+            self.give_ups += 1
+
+    def delay(self, attempt: int, response: t.Optional[Response] = None) -> float:
+        """
+        Work out how long to wait before the next attempt.
+
+        :param attempt: Zero-based number of the attempt that just failed.
+        :param response: The Response of the failed attempt, if one was received.
+        :return: Number of seconds to wait.
+        """
+
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+
+        ceiling = min(self.max_backoff, self.backoff * 2**attempt)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def stats(self) -> dict:
+        """
+        Report how often requests were retried and given up on.
+
+        :return: Dictionary with retry, give-up and circuit breaker counters.
+        """
+
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "give_ups": self.give_ups,
+                "circuit": self.breaker.state,
+                "circuit_trips": self.breaker.trips,
+            }
@@ -0,0 +1,108 @@
+import typing as t
+
+__all__ = ["Sanitiser"]
+
+
+class Sanitiser:
+    """Strips API URLs and null values from response data in a single iterative pass."""
+
+    def __init__(
+        self,
+        strip_prefixes: t.Iterable[str] = ("https://api.github.com",),
+        drop_nulls: bool = True,
+    ):
+        """
+        Initialise a Sanitiser.
+
+        :param strip_prefixes: Drop string values that start with any of these prefixes.
+        :param drop_nulls: If True, drop keys whose value is None.
+        """
+
+        # str.startswith() takes a tuple and checks every prefix in C
+        self.strip_prefixes = tuple(strip_prefixes)
+        self.drop_nulls = drop_nulls
+
+    @staticmethod
+    def project(
+        data: t.Union[dict, list], fields: t.Sequence[str]
+    ) -> t.Union[dict, list]:
+        """
+        Keep only the given top-level fields of an object, or of every object in a page.
+
+        Search results keep their envelope and have their 'items' projected.
+
+        :param data: The response data (dict or list).
+        :param fields: Names of the fields to keep.
+        :return: New, projected response data.
+        """
+
+        if type(data) is list:
+            return [
+                (
+                    {field: item[field] for field in fields if field in item}
+                    if type(item) is dict
+                    else item
+                )
+                for item in data
+            ]
+
+        if type(data) is dict:
+            if "total_count" in data and type(data.get("items")) is list:
+                return {**data, "items": Sanitiser.project(data["items"], fields)}
+            return {field: data[field] for field in fields if field in data}
+
+        return data
+
+    def sanitise(
+        self,
+        data: t.Union[dict, list],
+        fields: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Union[dict, list]:
+        """
+        Remove unwanted values from response data, in place unless it is projected.
+
+        Nested containers are walked with an explicit stack rather than recursion, so
+        arbitrarily deep payloads cannot exhaust the interpreter's recursion limit.
+        Projection happens first, so dropped fields are never walked.
+
+        :param data: The response data to sanitise (dict or list); scalars are
+            returned as they are.
+        :param fields: Optional top-level fields to keep (in each item, for lists).
+        :return: The sanitised data.
+        """
+
+        if fields:
+            data = self.project(data, fields)
+        if type(data) is not dict and type(data) is not list:
+            return data
+
+        prefixes = self.strip_prefixes
+        drop_nulls = self.drop_nulls
+        stack = [data]
+        pop, push = stack.pop, stack.append
+
+        # Decoded JSON only ever holds exact dicts, lists and strs, so type identity
+        # checks are safe here and cheaper than isinstance()
+        while stack:
+            node = pop()
+            if type(node) is dict:
+                unwanted = []
+                for key, value in node.items():
+                    kind = type(value)
+                    if kind is str:
+                        if value.startswith(prefixes):
+                            unwanted.append(key)
+                    elif value is None:
+                        if drop_nulls:
+                            unwanted.append(key)
+                    elif kind is dict or kind is list:
+                        push(value)
+                for key in unwanted:
+                    del node[key]
+            elif type(node) is list:
+                for item in node:
+                    kind = type(item)
+                    if kind is dict or kind is list:
+                        push(item)
+
+        return data
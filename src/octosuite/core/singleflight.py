@@ -0,0 +1,75 @@
+import threading
+import typing as t
+
+__all__ = ["SingleFlight"]
+
+
+class _Call:
+    """An in-flight call whose result is shared with every caller waiting on it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        """Initialise an in-flight call with no result yet."""
+
+        self.done = threading.Event()
+        self.result = None
+        self.error: t.Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls so that only one of them does the work."""
+
+    def __init__(self):
+        """Initialise the SingleFlight with no calls in flight."""
+
+        self._calls: dict[t.Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: t.Hashable, func: t.Callable[[], t.Any]):
+        """
+        Run a call, or wait for the identical call already in flight and share its result.
+
+        :param key: Key identifying identical calls, e.g. the response cache key.
+        :param func: The call to make if none with the same key is in flight.
+        :return: The call's result.
+        :raises Exception: Whatever the shared call raised.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        """
+        Report how many calls were made and how many were served by another caller's call.
+
+        :return: Dictionary with the 'calls' and 'shared' counters.
+        """
+
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
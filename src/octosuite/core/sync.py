@@ -0,0 +1,331 @@
+import sqlite3
+import time
+import typing as t
+from pathlib import Path
+
+from . import codec
+from .cache import default_cache_path, SQLiteConnections
+from .models import Org, Repo, User
+
+__all__ = ["SyncStore", "IncrementalSync"]
+
+
+class SyncStore:
+    """
+    Keeps synced items and the watermark of every stream in a local SQLite database.
+
+    A stream is one list endpoint, e.g. a repository's commits, named by its URL.
+    Items are stored by id, so an item fetched again (an issue that was updated, say)
+    replaces the stored copy. Like the disk cache, the database runs in WAL mode and
+    every thread gets its own connection.
+    """
+
+    def __init__(self, path: t.Optional[t.Union[str, Path]] = None):
+        """
+        Initialise the SyncStore, creating the database if needed.
+
+        :param path: Path of the database file, next to the disk cache if not given.
+        """
+
+        self.path = (
+            Path(path) if path else default_cache_path().with_name("sync.sqlite3")
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = SQLiteConnections(self.path)
+
+        with self._connection() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    stream TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    position TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (stream, id)
+                )
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    stream TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    synced_at REAL NOT NULL
+                )
+                """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection to the database, opening it on first use.
+
+        :return: The sqlite3 Connection.
+        """
+
+        return self._connections.get()
+
+    def watermark(self, stream: str) -> dict:
+        """
+        Look up how far a stream has been synced.
+
+        :param stream: Name of the stream.
+        :return: The stream's watermark, empty if it was never synced.
+        """
+
+        row = (
+            self._connection()
+            .execute("SELECT value FROM watermarks WHERE stream = ?", (stream,))
+            .fetchone()
+        )
+        return codec.loads(row[0]) if row else {}
+
+    def merge(
+        self,
+        stream: str,
+        items: t.Iterable[tuple[str, str, t.Any]],
+        watermark: dict,
+    ) -> int:
+        """
+        Store new and updated items and move the watermark, in one transaction.
+
+        :param stream: Name of the stream.
+        :param items: Tuples of (id, position, item), position being a string the
+            stream is ordered by.
+        :param watermark: The stream's new watermark.
+        :return: Number of items stored.
+        """
+
+        rows = [
+            (stream, str(item_id), position, codec.dumps(item))
+            for item_id, position, item in items
+        ]
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO items (stream, id, position, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO watermarks (stream, value, synced_at) "
+                "VALUES (?, ?, ?)",
+                (stream, codec.dumps(watermark), time.time()),
+            )
+        return len(rows)
+
+    def items(self, stream: str, limit: t.Optional[int] = None) -> list:
+        """
+        Read a stream's stored items, newest first.
+
+        :param stream: Name of the stream.
+        :param limit: Optional maximum number of items to return.
+        :return: List of items.
+        """
+
+        rows = self._connection().execute(
+            "SELECT data FROM items WHERE stream = ? ORDER BY position DESC LIMIT ?",
+            (stream, -1 if limit is None else limit),
+        )
+        return [codec.loads(data) for (data,) in rows]
+
+    def stats(self) -> dict:
+        """
+        Report how many streams and items the store holds.
+
+        :return: Dictionary with the stream and item counts.
+        """
+
+        connection = self._connection()
+        (streams,) = connection.execute("SELECT COUNT(*) FROM watermarks").fetchone()
+        (items,) = connection.execute("SELECT COUNT(*) FROM items").fetchone()
+        return {"streams": streams, "items": items}
+
+    def close(self):
+        """Close every connection opened by this store."""
+
+        self._connections.close()
+
+
+class IncrementalSync:
+    """
+    Brings the commits, issues and events of entities up to date in a SyncStore.
+
+    The first sync of a stream downloads all of it. Later syncs only fetch items newer
+    than the stream's watermark: through GitHub's `since` parameter for issues and
+    commits, and by stopping at the first item already seen for commits and events.
+    The first page is requested with the ETag of the last sync when its parameters
+    are unchanged, so a stream with nothing new costs a 304 reply, which does not
+    count against the rate limit.
+
+    A sync that fails part of the way raises, stores nothing and leaves the watermark
+    where it was, so the next sync fetches the same items again.
+    """
+
+    def __init__(self, store: t.Optional[SyncStore] = None, per_page: int = 100):
+        """
+        Initialise the IncrementalSync.
+
+        :param store: Store to merge items into, the default on-disk one if not given.
+        :param per_page: Number of items to request per page.
+        """
+
+        self.store = store or SyncStore()
+        self.per_page = per_page
+
+    def _collect(
+        self,
+        entity: t.Union[User, Org, Repo],
+        url: str,
+        params: dict,
+        watermark: dict,
+        stop: t.Callable[[dict], bool],
+    ) -> tuple[list, t.Optional[str]]:
+        """
+        Fetch the new items of a stream, following `Link: rel="next"` until an item
+        that was already synced.
+
+        :param entity: The entity whose client sends the requests.
+        :param url: URL of the stream.
+        :param params: Query parameters of the first page.
+        :param watermark: The stream's watermark, holding the ETag of the first page
+            at the last sync and the `since` parameter it was requested with.
+        :param stop: Returns True for the first item that was already synced.
+        :return: Tuple of (new items, ETag of the first page).
+        :raises requests.HTTPError: If a page could not be fetched.
+        """
+
+        client = entity.client
+        # An ETag only vouches for the page it came from, so a changed `since` voids it
+        etag = watermark.get("etag")
+        if watermark.get("since") != params.get("since"):
+            etag = None
+        response = client.request(
+            url=url, params=params, headers={"If-None-Match": etag} if etag else None
+        )
+        if response.status_code == 304:
+            return [], etag
+        first_etag = response.headers.get("ETag")
+
+        items = []
+        while True:
+            response.raise_for_status()
+            page = client.sanitise_response(codec.loads(response.content))
+            for item in page:
+                if stop(item):
+                    return items, first_etag
+                items.append(item)
+
+            next_url = response.links.get("next", {}).get("url")
+            if next_url is None:
+                return items, first_etag
+            response = client.request(url=next_url)
+
+    def commits(self, repo: Repo) -> list:
+        """
+        Sync a repository's commits.
+
+        Commits are requested from the committer date of the newest synced commit
+        onwards, and the walk stops at that commit.
+
+        :param repo: The repository.
+        :return: List of new commits, newest first.
+        """
+
+        url = f"{repo.endpoint}/commits"
+        watermark = self.store.watermark(url)
+        params = {"per_page": self.per_page}
+        if watermark.get("date"):
+            params["since"] = watermark["date"]
+
+        def date(commit: dict) -> str:
+            return (commit.get("commit", {}).get("committer") or {}).get("date", "")
+
+        commits, etag = self._collect(
+            repo,
+            url,
+            params,
+            watermark,
+            stop=lambda commit: commit.get("sha") == watermark.get("sha"),
+        )
+        if commits:
+            newest = max(commits, key=date)
+            watermark = {"sha": newest.get("sha"), "date": date(newest)}
+        self.store.merge(
+            url,
+            ((commit["sha"], date(commit), commit) for commit in commits),
+            {**watermark, "etag": etag, "since": params.get("since")},
+        )
+        return commits
+
+    def issues(self, repo: Repo) -> list:
+        """
+        Sync a repository's issues and pull requests, open and closed.
+
+        Issues updated since the last sync are requested and replace their stored copy.
+
+        :param repo: The repository.
+        :return: List of new and updated issues.
+        """
+
+        url = f"{repo.endpoint}/issues"
+        watermark = self.store.watermark(url)
+        params = {
+            "state": "all",
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": self.per_page,
+        }
+        if watermark.get("updated_at"):
+            params["since"] = watermark["updated_at"]
+
+        issues, etag = self._collect(
+            repo, url, params, watermark, stop=lambda issue: False
+        )
+        since = watermark.get("updated_at", "")
+        if issues:
+            watermark = {"updated_at": max(issue["updated_at"] for issue in issues)}
+        self.store.merge(
+            url,
+            ((issue["number"], f"{issue['number']:012d}", issue) for issue in issues),
+            {**watermark, "etag": etag, "since": params.get("since")},
+        )
+        # `since` is inclusive, so issues last updated at the watermark come back again
+        return [issue for issue in issues if issue["updated_at"] > since]
+
+    def events(self, entity: t.Union[User, Org, Repo]) -> list:
+        """
+        Sync the public events of a user, organisation or repository.
+
+        Events come newest first, so the walk stops at the newest event synced before.
+        GitHub only lists events of the last 90 days, up to 300 of them, so entities
+        with more activity than that between syncs lose the oldest new events.
+
+        :param entity: The user, organisation or repository.
+        :return: List of new events, newest first.
+        """
+
+        url = f"{entity.endpoint}/events"
+        watermark = self.store.watermark(url)
+        last_id = int(watermark.get("id", 0))
+
+        events, etag = self._collect(
+            entity,
+            url,
+            {"per_page": self.per_page},
+            watermark,
+            stop=lambda event: int(event["id"]) <= last_id,
+        )
+        if events:
+            watermark = {"id": max(int(event["id"]) for event in events)}
+        self.store.merge(
+            url,
+            ((event["id"], f"{int(event['id']):020d}", event) for event in events),
+            {**watermark, "etag": etag},
+        )
+        return events
+
+    def stored(self, entity: t.Union[User, Org, Repo], stream: str) -> list:
+        """
+        Read the items synced for an entity so far.
+
+        :param entity: The user, organisation or repository.
+        :param stream: "commits", "issues" or "events".
+        :return: List of items, newest first.
+        """
+
+        return self.store.items(f"{entity.endpoint}/{stream}")
@@ -0,0 +1,156 @@
+import os
+import threading
+import typing as t
+
+from requests import Response
+
+from .ratelimit import RateLimiter
+
+__all__ = ["Token", "TokenPool"]
+
+
+class Token:
+    """An API token with its own rate limit budgets and usage counters."""
+
+    def __init__(
+        self,
+        value: t.Optional[str],
+        wait: bool = True,
+        max_wait: t.Optional[float] = 300,
+    ):
+        """
+        Initialise a Token.
+
+        :param value: The personal access token, or None for unauthenticated requests.
+        :param wait: If True, wait for budget instead of raising RateLimitError.
+        :param max_wait: Longest single wait in seconds before giving up, None to always wait.
+        """
+
+        self.value = value
+        self.limiter = RateLimiter(wait=wait, max_wait=max_wait)
+        self.requests = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Masked representation of the token that is safe to print or log."""
+
+        if self.value is None:
+            return "anonymous"
+        return f"…{self.value[-4:]}"
+
+    def headers(self) -> dict:
+        """
+        Build the authorisation header for requests sent with this token.
+
+        :return: Dictionary with the Authorization header, empty for the anonymous token.
+        """
+
+        if self.value is None:
+            return {}
+        return {"Authorization": f"Bearer {self.value}"}
+
+    def record(self, url: str, response: Response) -> bool:
+        """
+        Count a response against this token and update its budgets.
+
+        :param url: The request URL.
+        :param response: The Response object.
+        :return: True if the request was rejected by a rate limit and should be sent again.
+        """
+
+        rejected = self.limiter.update(url, response)
+        with self._lock:
+            self.requests += 1
+            if rejected:
+                self.rejected += 1
+        return rejected
+
+    def stats(self) -> dict:
+        """
+        Report this token's usage and remaining budgets.
+
+        :return: Dictionary with the masked token, request counters and per-resource budgets.
+        """
+
+        with self._lock:
+            usage = {
+                "token": self.name,
+                "requests": self.requests,
+                "rejected": self.rejected,
+            }
+        usage.update(self.limiter.status())
+        return usage
+
+
+class TokenPool:
+    """Spreads requests across several tokens according to their remaining budgets."""
+
+    def __init__(
+        self,
+        tokens: t.Iterable[str] = (),
+        wait: bool = True,
+        max_wait: t.Optional[float] = 300,
+    ):
+        """
+        Initialise a TokenPool.
+
+        :param tokens: Personal access tokens to rotate between. With none, requests are
+            sent unauthenticated.
+        :param wait: If True, wait for budget instead of raising RateLimitError.
+        :param max_wait: Longest single wait in seconds before giving up, None to always wait.
+        """
+
+        values = [token for token in tokens if token] or [None]
+        self.tokens = [Token(value, wait=wait, max_wait=max_wait) for value in values]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "TokenPool":
+        """
+        Build a pool from the OCTOSUITE_TOKENS (comma-separated) or GITHUB_TOKEN variables.
+
+        :param kwargs: Extra keyword arguments for the TokenPool.
+        :return: The TokenPool, unauthenticated if neither variable is set.
+        """
+
+        tokens = os.environ.get("OCTOSUITE_TOKENS") or os.environ.get(
+            "GITHUB_TOKEN", ""
+        )
+        return cls(tokens=[token.strip() for token in tokens.split(",")], **kwargs)
+
+    def acquire(self, url: str) -> Token:
+        """
+        Pick the token best placed to send a request and take budget from it.
+
+        Tokens that can send right away win, and among those the one with the most
+        remaining budget for the URL's resource. An exhausted token is therefore
+        skipped until every token is exhausted, in which case the one that resets
+        first is waited for.
+
+        :param url: The request URL.
+        :return: The Token to send the request with.
+        :raises RateLimitError: If every token is exhausted and waiting is not allowed.
+        """
+
+        resource = RateLimiter.resource_for(url)
+        with self._lock:
+            token = min(
+                self.tokens,
+                key=lambda candidate: (
+                    candidate.limiter.bucket(resource).delay(),
+                    -candidate.limiter.bucket(resource).available(),
+                ),
+            )
+        token.limiter.acquire(url)
+        return token
+
+    def stats(self) -> list[dict]:
+        """
+        Report usage and remaining budgets for every token in the pool.
+
+        :return: List of per-token statistics dictionaries.
+        """
+
+        return [token.stats() for token in self.tokens]
@@ -0,0 +1,126 @@
+import os
+import re
+import threading
+import typing as t
+from urllib.parse import urlparse
+
+__all__ = ["TTLPolicy"]
+
+
+class TTLPolicy:
+    """
+    Decides how long a cached response stays fresh, based on the endpoint it came from.
+
+    Rules map endpoint patterns to a number of seconds, or None for entries that never
+    expire. Patterns are matched against the end of the URL path, so they work with any
+    base URL, and `*` stands for a single path segment, e.g. `/repos/*/*/events`. The
+    first matching rule wins.
+    """
+
+    # Event streams go stale within minutes, profiles and languages rarely change
+    DEFAULT_RULES = (
+        ("/users/*/events", 60),
+        ("/users/*/received_events", 60),
+        ("/orgs/*/events", 60),
+        ("/repos/*/*/events", 60),
+        ("/repos/*/*/issue_events", 60),
+        ("/search/*", 300),
+        ("/repos/*/*/languages", 86400),
+        ("/users/*", 21600),
+        ("/orgs/*", 21600),
+        ("/repos/*/*", 21600),
+    )
+
+    def __init__(
+        self,
+        rules: t.Optional[t.Iterable[tuple[str, t.Optional[float]]]] = None,
+    ):
+        """
+        Initialise a TTLPolicy.
+
+        :param rules: Iterable of (pattern, seconds) rules, checked before the defaults.
+        """
+
+        self._rules: list[tuple[str, re.Pattern, t.Optional[float]]] = []
+        self._lock = threading.Lock()
+        for pattern, ttl in reversed(self.DEFAULT_RULES):
+            self.set(pattern, ttl)
+        for pattern, ttl in reversed(list(rules or ())):
+            self.set(pattern, ttl)
+
+    @classmethod
+    def from_env(cls) -> "TTLPolicy":
+        """
+        Create a policy with the overrides in OCTOSUITE_CACHE_TTL.
+
+        The variable holds comma-separated `pattern=seconds` rules, where seconds may be
+        "never", e.g. `/repos/*/*/events=30,/users/*=never`.
+
+        :return: The TTLPolicy.
+        :raises ValueError: If a rule is malformed.
+        """
+
+        rules = []
+        for rule in os.environ.get("OCTOSUITE_CACHE_TTL", "").split(","):
+            if not rule.strip():
+                continue
+            pattern, _, seconds = rule.partition("=")
+            seconds = seconds.strip()
+            if not pattern.strip() or not seconds:
+                raise ValueError(f"Invalid cache TTL rule: {rule!r}")
+            rules.append(
+                (pattern.strip(), None if seconds == "never" else float(seconds))
+            )
+        return cls(rules=rules)
+
+    @staticmethod
+    def _compile(pattern: str) -> re.Pattern:
+        """
+        Turn an endpoint pattern into a regular expression.
+
+        :param pattern: Endpoint pattern, `*` matching one path segment.
+        :return: Compiled expression matching the end of a URL path.
+        """
+
+        segments = (
+            "[^/]+" if segment == "*" else re.escape(segment)
+            for segment in pattern.strip("/").split("/")
+        )
+        return re.compile(f"/{'/'.join(segments)}/?$")
+
+    def set(self, pattern: str, ttl: t.Optional[float]):
+        """
+        Add or replace a rule, giving it priority over every existing rule.
+
+        :param pattern: Endpoint pattern, `*` matching one path segment.
+        :param ttl: Seconds an entry for the endpoint stays fresh, None to never expire.
+        """
+
+        compiled = self._compile(pattern)
+        with self._lock:
+            self._rules = [rule for rule in self._rules if rule[0] != pattern]
+            self._rules.insert(0, (pattern, compiled, ttl))
+
+    def ttl_for(self, url: str, default: t.Optional[float] = None) -> t.Optional[float]:
+        """
+        Look up how long a response from a URL stays fresh.
+
+        :param url: The request URL.
+        :param default: Value to return when no rule matches.
+        :return: Number of seconds, or None to never expire.
+        """
+
+        path = urlparse(url).path
+        for _, compiled, ttl in self._rules:
+            if compiled.search(path):
+                return ttl
+        return default
+
+    def rules(self) -> list[tuple[str, t.Optional[float]]]:
+        """
+        List the rules in the order they are checked.
+
+        :return: List of (pattern, seconds) tuples.
+        """
+
+        return [(pattern, ttl) for pattern, _, ttl in self._rules]
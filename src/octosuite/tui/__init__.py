@@ -1,6 +1,7 @@
 """Terminal user interface for octosuite."""
 
 from .menus import Menus
+from ..core.models import github
 
 __all__ = ["run", "Menus"]
 
@@ -8,5 +9,8 @@ __all__ = ["run", "Menus"]
 def run():
     """Run the interactive TUI."""
 
+    # Revisiting a target answers from the cache at once while it refreshes behind the menu
+    github.stale_while_revalidate = True
+
     menu = Menus()
     menu.main()
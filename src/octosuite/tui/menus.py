@@ -3,6 +3,7 @@ import typing as t
 
 import questionary as q
 from questionary import Style
+from requests import RequestException
 from rich.status import Status
 
 from .dialogs import Dialogs
@@ -11,6 +12,7 @@ from .._lib import check_updates, preview_response, export_response, set_menu_ti
 from .._lib import console, clear_screen, ascii_banner
 from ..core.cache import cache
 from ..core.models import User, Repo, Org, Search
+from ..core.ratelimit import RateLimitError
 
 CUSTOM_STYLE = Style(
     [
@@ -102,7 +104,10 @@ class BaseMenu:
             f"[dim]Validating {target_type} ({identifier})[/dim]…",
             console=console,
         ) as status:
-            exists, response = instance.exists()
+            try:
+                exists, response = instance.exists()
+            except (RateLimitError, RequestException) as error:
+                exists, response = False, {"message": str(error)}
 
             if not exists:
                 status.stop()
@@ -138,12 +143,18 @@ class BaseMenu:
                 status=f"[dim]Initialising {target_type} {method_name}[/dim]…",
                 console=console,
             ) as status:
-                data = self.execute_selection(
-                    source=source,
-                    instance=instance,
-                    method_name=method_name,
-                    status=status,
-                )
+                try:
+                    data = self.execute_selection(
+                        source=source,
+                        instance=instance,
+                        method_name=method_name,
+                        status=status,
+                    )
+                except (RateLimitError, RequestException) as error:
+                    status.stop()
+                    console.print(f"[bold][yellow]✘[/yellow] {error}[/bold]")
+                    console.input("  Press [bold]ENTER[/bold] to continue …")
+                    return
 
                 status.stop()
                 self.response_handler(data=data, data_type=method_name, source=source)
@@ -336,7 +347,7 @@ class Menus(BaseMenu):
                     q.Choice(
                         title="Clear cache",
                         value="clear_cache",
-                        description="Clear all in-memory cache from Octosuite",
+                        description="Clear all cached responses from Octosuite",
                     ),
                     q.Choice(
                         title="Updates",
@@ -485,7 +496,13 @@ class Menus(BaseMenu):
 
                 method = getattr(search, option)
                 status.update(f"[dim]Searching {option} for {query}[/dim]…")
-                data = method()
+                try:
+                    data = method(all_pages=params["all_pages"])
+                except (RateLimitError, RequestException) as error:
+                    status.stop()
+                    console.print(f"[bold][yellow]✘[/yellow] {error}[/bold]")
+                    console.input("  Press [bold]ENTER[/bold] to continue …")
+                    data = None
 
                 if data:
                     items = data.get("items")
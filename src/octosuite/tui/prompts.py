@@ -51,7 +51,8 @@ class Prompts:
         """
         Prompt the user for pagination parameters.
 
-        :return: Dictionary containing 'page' and 'per_page' integer values.
+        :return: Dictionary containing 'page' and 'per_page' integer values, and the
+            'all_pages' flag.
         """
 
         try:
@@ -61,12 +62,16 @@ class Prompts:
                 default="100",
                 qmark="n",
             ).ask()
+            all_pages = q.confirm(
+                message="Fetch all pages from here on?", default=False, qmark="n"
+            ).ask()
 
             return {
                 "page": int(page) if page else 1,
                 "per_page": min(int(per_page) if per_page else 100, 100),
+                "all_pages": bool(all_pages),
             }
 
         except (ValueError, TypeError):
             print("Invalid input, using defaults (page=1, per_page=100)")
-            return {"page": 1, "per_page": 100}
+            return {"page": 1, "per_page": 100, "all_pages": False}